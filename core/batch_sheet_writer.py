@@ -22,38 +22,41 @@ import pandas as pd
 from core.case_types import CANONICAL_TO_PRETTY
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+from openpyxl.styles.fonts import DEFAULT_FONT
 
 
 # ===== Formatting helpers ====================================================
 
+# Column widths keyed by letter (the layout is fixed, so no per-sheet lookups)
+COLUMN_WIDTHS = (
+    ("B", 45),  # Contingency Events
+    ("C", 45),  # Resulting Issue
+    ("D", 15),  # Limit
+    ("E", 15),  # Left %
+    ("F", 15),  # Right %
+    ("G", 22),  # Delta / Status
+)
+
+
 def apply_table_styles(ws: Worksheet):
     """Set reasonable column widths and outline settings for a formatted comparison sheet."""
-    widths = {
-        2: 45,  # B: Contingency Events
-        3: 45,  # C: Resulting Issue
-        4: 15,  # D: Limit
-        5: 15,  # E: Left %
-        6: 15,  # F: Right %
-        7: 22,  # G: Delta / Status
-    }
-    for col_idx, width in widths.items():
-        ws.column_dimensions[get_column_letter(col_idx)].width = width
+    for letter, width in COLUMN_WIDTHS:
+        ws.column_dimensions[letter].width = width
 
     # Make outline symbols visible + summary row above details
-    try:
-        ws.sheet_properties.outlinePr.summaryBelow = False
-        ws.sheet_properties.outlinePr.summaryRight = False
-        ws.sheet_properties.outlinePr.applyStyles = True
-    except Exception:
-        pass
+    outline = getattr(getattr(ws, "sheet_properties", None), "outlinePr", None)
+    if outline is not None:
+        outline.summaryBelow = False
+        outline.summaryRight = False
+        outline.applyStyles = True
 
-    try:
-        ws.sheet_view.showOutlineSymbols = True
-    except Exception:
-        pass
+    view = getattr(ws, "sheet_view", None)
+    if view is not None:
+        view.showOutlineSymbols = True
 
 
 HEADER_FILL = PatternFill("solid", fgColor="305496")  # dark blue
@@ -70,6 +73,23 @@ THIN_BORDER = Border(
 
 CELL_ALIGN_WRAP = Alignment(wrap_text=True, vertical="top")
 CELL_ALIGN_CENTER = Alignment(horizontal="center", vertical="center", wrap_text=True)
+CELL_ALIGN_RIGHT = Alignment(horizontal="right", vertical="top")
+
+# Shared bold body font (default workbook font + bold). openpyxl interns styles,
+# so one instance keeps per-cell style work O(1).
+BOLD_FONT = Font(
+    name=DEFAULT_FONT.name,
+    size=DEFAULT_FONT.size,
+    color=DEFAULT_FONT.color,
+    bold=True,
+)
+
+
+def is_blank(v) -> bool:
+    """True for an empty or whitespace-only cell value (shared by the sheet parsers)."""
+    # Exact type check: openpyxl only hands back plain str, and this skips the
+    # isinstance() MRO walk on the per-cell hot path.
+    return v is None or (type(v) is str and not v.strip())
 
 
 def _is_nan(x) -> bool:
@@ -105,12 +125,12 @@ def _normalize_issue_series(series: pd.Series) -> pd.Series:
 
 
 def _write_title_row(ws: Worksheet, row: int, title: str):
-    ws.merge_cells(start_row=row, start_column=2, end_row=row, end_column=7)  # B..G
-    cell = ws.cell(row=row, column=2)
-    cell.value = title
+    cell = WriteOnlyCell(ws, value=title)
     cell.fill = TITLE_FILL
     cell.font = TITLE_FONT
     cell.alignment = CELL_ALIGN_CENTER
+    ws.append([None, cell])
+    ws.merged_cells.add(CellRange(min_col=2, min_row=row, max_col=7, max_row=row))  # B..G
 
 
 def _write_header_row(ws: Worksheet, row: int):
@@ -122,13 +142,15 @@ def _write_header_row(ws: Worksheet, row: int):
         "Right %",
         "Δ% (Right - Left) / Status",
     ]
-    for col_offset, header in enumerate(headers):
-        cell = ws.cell(row=row, column=2 + col_offset)
-        cell.value = header
+    cells = [None]
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
         cell.fill = HEADER_FILL
         cell.font = HEADER_FONT
         cell.alignment = CELL_ALIGN_CENTER
         cell.border = THIN_BORDER
+        cells.append(cell)
+    ws.append(cells)
 
 
 def _write_data_row(
@@ -144,44 +166,41 @@ def _write_data_row(
     outline_level: int = 0,
     hidden: bool = False,
     bold: bool = False,
+    collapsed: bool = False,
 ):
     values = [cont, issue, limit, left_pct, right_pct, delta]
 
+    # Outline / hidden controls (Excel +/-). These must be set before the row
+    # is appended: write-only sheets stream the row out immediately.
+    if outline_level or hidden or collapsed:
+        dims = ws.row_dimensions[row]
+        dims.outlineLevel = int(outline_level)
+        dims.hidden = bool(hidden)
+        if collapsed:
+            dims.collapsed = True
+
+    cells = [None]
     for col_offset, val in enumerate(values):
-        cell = ws.cell(row=row, column=2 + col_offset)
-        cell.value = val
+        cell = WriteOnlyCell(ws, value=val)
         cell.border = THIN_BORDER
 
         if bold:
-            base = cell.font or Font()
-            cell.font = Font(
-                name=base.name,
-                size=base.size,
-                bold=True,
-                italic=base.italic,
-                vertAlign=base.vertAlign,
-                underline=base.underline,
-                strike=base.strike,
-                color=base.color,
-            )
+            cell.font = BOLD_FONT
 
         # Align
         if col_offset in (0, 1):
             cell.alignment = CELL_ALIGN_WRAP
         else:
-            cell.alignment = Alignment(horizontal="right", vertical="top")
+            cell.alignment = CELL_ALIGN_RIGHT
 
         # Number formats
         # Left/Right are now offsets 3 and 4
         if col_offset in (3, 4) and isinstance(val, (float, int)):
             cell.number_format = "0.00"
 
-    # Outline / hidden controls (Excel +/-)
-    try:
-        ws.row_dimensions[row].outlineLevel = int(outline_level)
-        ws.row_dimensions[row].hidden = bool(hidden)
-    except Exception:
-        pass
+        cells.append(cell)
+
+    ws.append(cells)
 
 
 def write_formatted_pair_sheet(
@@ -191,12 +210,20 @@ def write_formatted_pair_sheet(
     *,
     expandable_issue_view: bool = True,
 ):
-    """Create one sheet in the batch workbook using the blue-block style."""
+    """
+    Create one sheet in the batch workbook using the blue-block style.
+
+    Rows are written strictly top-to-bottom with ws.append(), so this works
+    with both normal and write-only (streaming) workbooks.
+    """
     ws = wb.create_sheet(title=ws_name)
     apply_table_styles(ws)
 
+    # Row 1 stays empty; blocks start at row 2.
+    ws.append([])
+
     if df_pair is None or df_pair.empty:
-        ws.cell(row=2, column=2).value = "No rows above threshold."
+        ws.append([None, "No rows above threshold."])
         return
 
     current_row = 2
@@ -243,6 +270,7 @@ def write_formatted_pair_sheet(
                 )
                 current_row += 1
 
+            ws.append([])
             current_row += 1
             continue
 
@@ -262,7 +290,8 @@ def write_formatted_pair_sheet(
 
             g = g.sort_values(by="_SortKey", ascending=False, na_position="last")
 
-            summary_row_index = None
+            # The summary row is streamed before its details, so decide up front.
+            has_details = len(g) > 1
             first = True
 
             for _, r in g.iterrows():
@@ -277,9 +306,6 @@ def write_formatted_pair_sheet(
                 right_pct = r.get("RightPct", None)
                 delta = str(r.get("DeltaDisplay", "") or "")
 
-                if first:
-                    summary_row_index = current_row
-
                 _write_data_row(
                     ws,
                     current_row,
@@ -292,19 +318,14 @@ def write_formatted_pair_sheet(
                     outline_level=0 if first else 1,
                     hidden=False if first else True,
                     bold=True if first else False,
+                    collapsed=first and has_details,
                 )
                 current_row += 1
                 first = False
 
-            # Mark the summary row as collapsed when there are details
-            try:
-                if summary_row_index is not None and len(g) > 1:
-                    ws.row_dimensions[summary_row_index].collapsed = True
-            except Exception:
-                pass
-
         # Blank row between blocks
+        ws.append([])
         current_row += 1
 
     if not wrote_block:
-        ws.cell(row=2, column=2).value = "No rows above threshold."
+        ws.append([None, "No rows above threshold."])
@@ -1,22 +1,51 @@
 # core/case_finder.py
 
 import os
+import re
+from functools import lru_cache
 
 from .case_types import TARGET_PATTERNS
 
-
-def _find_pwb_files(folder: str):
-    """Return a list of .pwb filenames (no paths) in the folder."""
-    return [f for f in os.listdir(folder) if f.lower().endswith(".pwb")]
+# All TARGET_PATTERNS folded into one case-insensitive regex, built once.
+# Each alternative is `.*?(pattern)` anchored at the start, so alternatives are
+# tried in dict order and the first label whose pattern occurs anywhere in the
+# name wins, exactly as a per-pattern loop would. Group N maps to label N.
+_TARGET_LABELS = tuple(TARGET_PATTERNS)
+_TARGET_RE = re.compile(
+    "|".join(f".*?({re.escape(pattern)})" for pattern in TARGET_PATTERNS.values()),
+    re.IGNORECASE | re.DOTALL,
+)
 
 
+def _find_pwb_files(folder: str):
+    """Return (filename, full path) pairs for the .pwb files in the folder, sorted by name."""
+    # scandir yields name and path from a single directory read, so there is
+    # no separate join per entry. Like the old listdir() scan, this matches on
+    # the name only.
+    with os.scandir(folder) as it:
+        entries = [
+            (entry.name, entry.path)
+            for entry in it
+            if entry.name.lower().endswith(".pwb")
+        ]
+    entries.sort()
+    return entries
+
+
+def list_subfolders(folder: str):
+    """Return the sorted names of the immediate subfolders of `folder`."""
+    with os.scandir(folder) as it:
+        return sorted(entry.name for entry in it if entry.is_dir())
+
+
+# The same case file names come back on every rescan of a folder.
+@lru_cache(maxsize=4096)
 def _classify_case(filename: str) -> str:
     """Return the case type label based on TARGET_PATTERNS, or 'Other'."""
-    filename_lower = filename.lower()
-    for label, pattern in TARGET_PATTERNS.items():
-        if pattern.lower() in filename_lower:
-            return label
-    return "Other"
+    m = _TARGET_RE.match(filename)
+    if m is None:
+        return "Other"
+    return _TARGET_LABELS[m.lastindex - 1]
 
 
 def scan_folder(folder: str, log_func=None):
@@ -44,8 +73,7 @@ def scan_folder(folder: str, log_func=None):
             log_func("No .pwb files found in folder.")
         return cases, target_cases
 
-    for fname in sorted(pwb_files):
-        fpath = os.path.join(folder, fname)
+    for fname, fpath in pwb_files:
         ctype = _classify_case(fname)
         is_target = ctype != "Other"
 
@@ -70,7 +98,7 @@ def scan_folder(folder: str, log_func=None):
 
     if log_func:
         log_func("Folder scan complete.")
-        for label in TARGET_PATTERNS:
+        for label in _TARGET_LABELS:
             if label in target_cases:
                 log_func(f"  Found target case [{label}]: {target_cases[label]}")
             else:
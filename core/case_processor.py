@@ -1,3 +1,4 @@
+import csv
 import os
 import pandas as pd
 
@@ -5,9 +6,20 @@ from .pwb_exporter import export_violation_ctg
 from .column_blacklist import (
     apply_blacklist,
     apply_row_filter,
+    is_blacklisted,
+    ROW_FILTER_COLUMN,
     apply_limviolid_max_filter,
 )
 
+# Rows parsed per pandas chunk when reading a ViolationCTG export.
+CSV_CHUNK_ROWS = 50_000
+
+# Size of the filtered-data preview written to the log. Exports have 100+
+# columns, and formatting all of them costs more than the preview is worth.
+PREVIEW_ROWS = 10
+PREVIEW_MAX_COLS = 15
+PREVIEW_MAX_COLWIDTH = 20
+
 
 def _make_filtered_path(original_csv: str) -> str:
     base, ext = os.path.splitext(original_csv)
@@ -16,7 +28,29 @@ def _make_filtered_path(original_csv: str) -> str:
     return f"{base}_Filtered{ext}"
 
 
-def post_process_csv(csv_path: str, dedup_enabled: bool, keep_categories, log_func=None) -> str:
+def _numeric_kind(values, kind):
+    """
+    Fold one chunk of a text column into the type pandas' inference would give
+    the whole column: "i" (all integers), "f" (numbers, any float or missing)
+    or None (not numeric). kind is the result for the chunks before this one.
+    """
+    if kind is None:
+        return None
+    try:
+        num = pd.to_numeric(values)
+    except (ValueError, TypeError):
+        return None
+    return "f" if kind == "f" or num.dtype.kind == "f" else "i"
+
+
+def post_process_csv(
+    csv_path: str,
+    dedup_enabled: bool,
+    keep_categories,
+    log_func=None,
+    show_preview: bool = True,
+    preview_func=None,
+) -> str:
     """
     Apply:
       1) Row filter (LimViolCat) using keep_categories
@@ -27,6 +61,10 @@ def post_process_csv(csv_path: str, dedup_enabled: bool, keep_categories, log_fu
             leave row order as-is
       3) Column blacklist
 
+    If show_preview is set, the first rows of the filtered data are shown:
+    passed to preview_func(columns, rows) when given (e.g. a GUI table), else
+    logged as a text table trimmed to the first columns.
+
     Returns:
         path to filtered CSV (or None on failure)
     """
@@ -34,36 +72,102 @@ def post_process_csv(csv_path: str, dedup_enabled: bool, keep_categories, log_fu
         log_func("\nReading CSV to detect headers...")
 
     try:
-        # Skip the first row because it only has "ViolationCTG" in one column.
-        raw = pd.read_csv(csv_path, header=None, skiprows=1)
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            # Skip the first row because it only has "ViolationCTG" in one column.
+            next(f, None)
 
-        if raw.shape[0] < 1:
+            # Row 2 holds the real headers. Read it here and let pandas parse
+            # only the data rows, as text, so no header-less copy of the whole
+            # table is ever built.
+            header_row = next(csv.reader(f), None)
+
+        if not header_row:
             if log_func:
                 log_func("Not enough rows in CSV to extract headers (need at least 1).")
             return None
 
-        header_row = list(raw.iloc[0])
-
         if log_func:
             log_func(f"Detected {len(header_row)} headers from row 2.")
 
-        if raw.shape[0] <= 1:
+        # The column blacklist (step 3) is known from the header alone, so
+        # blacklisted columns are never parsed: usecols keeps only the
+        # surviving positions, plus LimViolCat, which the row filter needs
+        # before it is dropped. None of the columns the LimViolID sort uses
+        # are blacklisted, so dropping columns early changes nothing else.
+        removed_cols = [c for c in header_row if is_blacklisted(c)]
+        usecols = [
+            i
+            for i, c in enumerate(header_row)
+            if c == ROW_FILTER_COLUMN or not is_blacklisted(c)
+        ]
+        read_cols = [header_row[i] for i in usecols]
+
+        # Everything is read as text, but a column with a blank header has no
+        # text cell to stop pandas' type inference from making it numeric, and
+        # the filtered CSV has always carried those values as numbers
+        # ("007" -> 7). Track, per blank-header column, the type inference
+        # would pick over all data rows.
+        blank_read_pos = [j for j, c in enumerate(read_cols) if c == ""]
+        blank_kinds = ["i"] * len(blank_read_pos)
+
+        # 1) Row filter with chosen categories, applied chunk by chunk as
+        # the file is read, so rows that get dropped are never all held
+        # in memory at once.
+        chunks = []
+        removed_rows = 0
+        try:
+            # memory_map lets the C parser read straight from the OS page
+            # cache instead of copying the file through Python buffers.
+            reader = pd.read_csv(
+                csv_path,
+                header=None,
+                skiprows=2,
+                usecols=usecols,
+                dtype=str,
+                chunksize=CSV_CHUNK_ROWS,
+                memory_map=True,
+            )
+            try:
+                for i, chunk in enumerate(reader):
+                    if i == 0 and log_func:
+                        cats_txt = ", ".join(sorted(keep_categories)) if keep_categories else "NONE"
+                        log_func(f"\nApplying row filter for LimViolCat categories: {cats_txt}")
+
+                    chunk.columns = read_cols
+                    for k, j in enumerate(blank_read_pos):
+                        blank_kinds[k] = _numeric_kind(chunk.iloc[:, j], blank_kinds[k])
+                    chunk, removed = apply_row_filter(
+                        chunk,
+                        keep_values=keep_categories,
+                        log_func=log_func if i == 0 else None,
+                    )
+                    chunk, _ = apply_blacklist(chunk)
+                    chunks.append(chunk)
+                    removed_rows += removed
+            finally:
+                # Release the mapping/handle before the export is deleted.
+                reader.close()
+        except pd.errors.EmptyDataError:
+            pass
+
+        if not chunks:
             if log_func:
                 log_func("No data rows found after header row; nothing to filter.")
             return None
 
-        # Data rows are index >= 1
-        data = raw.iloc[1:].copy()
-        data.columns = header_row
+        filtered_data = chunks[0] if len(chunks) == 1 else pd.concat(chunks)
+        # Drop the per-chunk frames now; otherwise they stay alive next to the
+        # concatenated copy through sorting and the CSV write.
+        del chunks
 
-        # 1) Row filter with chosen categories
-        if log_func:
-            cats_txt = ", ".join(sorted(keep_categories)) if keep_categories else "NONE"
-            log_func(f"\nApplying row filter for LimViolCat categories: {cats_txt}")
-
-        filtered_data, removed_rows = apply_row_filter(
-            data, keep_values=keep_categories, log_func=log_func
-        )
+        # Blank-header columns had their type inferred over the whole file,
+        # rows the filter drops included, so convert them only now. A blank
+        # header is never blacklisted, so they keep their order.
+        blank_out_pos = [pos for pos, c in enumerate(filtered_data.columns) if c == ""]
+        for pos, kind in zip(blank_out_pos, blank_kinds):
+            if kind is not None:
+                values = pd.to_numeric(filtered_data.iloc[:, pos])
+                filtered_data.isetitem(pos, values.astype("float64") if kind == "f" else values)
 
         if log_func:
             log_func(f"Rows removed by row filter: {removed_rows}")
@@ -84,17 +188,15 @@ def post_process_csv(csv_path: str, dedup_enabled: bool, keep_categories, log_fu
             if log_func:
                 log_func("\nExpandable issue view disabled; leaving all rows unsorted by LimViolID.")
 
-        # 3) Column blacklist
+        # 3) Column blacklist (already applied while reading)
         if log_func:
             log_func("\nApplying column blacklist...")
-
-        filtered_data, removed_cols = apply_blacklist(filtered_data)
-
-        if log_func:
             if removed_cols:
-                log_func("Columns removed by blacklist:")
-                for c in removed_cols:
-                    log_func(f"  - {c}")
+                # One call for the whole list; GUI log sinks redraw per call.
+                log_func(
+                    "Columns removed by blacklist:\n"
+                    + "\n".join(f"  - {c}" for c in removed_cols)
+                )
             else:
                 log_func("No columns matched blacklist; no columns removed.")
 
@@ -104,8 +206,24 @@ def post_process_csv(csv_path: str, dedup_enabled: bool, keep_categories, log_fu
 
         if log_func:
             log_func(f"Filtered CSV saved to:\n  {filtered_csv}")
-            log_func("\nPreview of first few filtered data rows:")
-            preview = filtered_data.head(10).to_string(index=False)
+
+        if show_preview and preview_func is not None:
+            head = filtered_data.head(PREVIEW_ROWS).fillna("")
+            preview_func(list(head.columns), list(head.itertuples(index=False, name=None)))
+            if log_func:
+                log_func("\nPreview of first few filtered data rows shown in the preview table.")
+        elif log_func and show_preview:
+            n_cols = filtered_data.shape[1]
+            if n_cols > PREVIEW_MAX_COLS:
+                log_func(
+                    f"\nPreview of first few filtered data rows "
+                    f"(first {PREVIEW_MAX_COLS} of {n_cols} columns):"
+                )
+            else:
+                log_func("\nPreview of first few filtered data rows:")
+            preview = filtered_data.iloc[:PREVIEW_ROWS, :PREVIEW_MAX_COLS].to_string(
+                index=False, max_colwidth=PREVIEW_MAX_COLWIDTH
+            )
             log_func(preview)
 
         return filtered_csv
@@ -122,6 +240,8 @@ def process_case(
     keep_categories,
     delete_original: bool,
     log_func=None,
+    show_preview: bool = True,
+    preview_func=None,
 ) -> str:
     """
     Full pipeline for a single .pwb:
@@ -140,13 +260,24 @@ def process_case(
     if log_func:
         log_func(f"Exported CSV path: {csv_out}")
 
-    filtered_csv = post_process_csv(csv_out, dedup_enabled, keep_categories, log_func)
+    filtered_csv = post_process_csv(
+        csv_out,
+        dedup_enabled,
+        keep_categories,
+        log_func,
+        show_preview=show_preview,
+        preview_func=preview_func,
+    )
 
-    if delete_original and filtered_csv and os.path.exists(csv_out):
+    if delete_original and filtered_csv:
+        # Remove directly instead of exists() + remove(): one filesystem call,
+        # which matters on network-mounted case folders.
         try:
             os.remove(csv_out)
             if log_func:
                 log_func(f"Deleted original (unfiltered) CSV: {csv_out}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             if log_func:
                 log_func(f"WARNING: Failed to delete original CSV: {e}")
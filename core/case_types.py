@@ -18,7 +18,8 @@ PRETTY_TO_CANONICAL = {
 # Backward-compatible title used by older workbooks.
 PRETTY_TO_CANONICAL["ACCA Long Term"] = "ACCA_LongTerm"
 
-PRETTY_CASE_TITLES = tuple(PRETTY_TO_CANONICAL)
+# Membership-only lookup (scanned per cell during sheet discovery).
+PRETTY_CASE_TITLES = frozenset(PRETTY_TO_CANONICAL)
 
 # Filename matching is case-insensitive.
 TARGET_PATTERNS = {
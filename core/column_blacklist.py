@@ -180,9 +180,11 @@ def is_blacklisted(col_name: str) -> bool:
 def apply_blacklist(df):
     """Remove columns from the DataFrame."""
     original_cols = list(df.columns)
-    keep_cols = [c for c in original_cols if not is_blacklisted(c)]
-    removed_cols = [c for c in original_cols if c not in keep_cols]
-    filtered_df = df[keep_cols].copy()
+    keep_mask = [not is_blacklisted(c) for c in original_cols]
+    removed_cols = [c for c, keep in zip(original_cols, keep_mask) if not keep]
+    # Select by position: df[names] would repeat every duplicated header once
+    # per occurrence.
+    filtered_df = df.loc[:, keep_mask].copy()
     return filtered_df, removed_cols
 
 
@@ -221,10 +223,15 @@ def apply_row_filter(df, keep_values=None, log_func=None):
             log_func("Row filter disabled: no LimViolCat categories selected.")
         return df, 0
 
-    before = len(df)
-    filtered_df = df[df[ROW_FILTER_COLUMN].isin(keep_values)].copy()
-    after = len(filtered_df)
-    removed = before - after
+    # One vectorised membership test -> plain NumPy bool mask. Boolean
+    # indexing already returns a new frame, so no extra .copy() is needed.
+    mask = df[ROW_FILTER_COLUMN].isin(keep_values).to_numpy()
+    kept = int(mask.sum())
+    if kept == len(df):
+        return df, 0
+
+    filtered_df = df[mask]
+    removed = len(df) - kept
 
     return filtered_df, removed
 
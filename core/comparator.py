@@ -30,7 +30,7 @@ try:
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
-from core.batch_sheet_writer import write_formatted_pair_sheet
+from core.batch_sheet_writer import is_blank as _is_blank, write_formatted_pair_sheet
 from core.case_types import (
 CANONICAL_TO_PRETTY,
     CASE_TYPES_CANONICAL,
@@ -61,14 +61,6 @@ def list_sheets(workbook_path: str) -> List[str]:
         wb.close()
 
 
-def _is_blank(v) -> bool:
-    if v is None:
-        return True
-    if isinstance(v, str) and v.strip() == "":
-        return True
-    return False
-
-
 def _header_has_limit(ws, header_row: int) -> bool:
     """Return True if the formatted header row includes a 'Limit' column in D."""
     try:
@@ -91,6 +83,11 @@ def _parse_scenario_sheet(ws, log_func=None) -> pd.DataFrame:
     """
     records: List[Dict] = []
 
+    # Local names for the row loop below
+    to_canonical = PRETTY_TO_CANONICAL.get
+    is_blank = _is_blank
+    add_record = records.append
+
     max_row = ws.max_row or 1
     row_idx = 1
 
@@ -100,7 +97,7 @@ def _parse_scenario_sheet(ws, log_func=None) -> pd.DataFrame:
 
         if isinstance(title_val, str) and title_val.strip():
             pretty_name = title_val.strip()
-            case_type = PRETTY_TO_CANONICAL.get(pretty_name, pretty_name)
+            case_type = to_canonical(pretty_name, pretty_name)
 
             header_row = row_idx + 1
             data_row = header_row + 1
@@ -118,24 +115,30 @@ def _parse_scenario_sheet(ws, log_func=None) -> pd.DataFrame:
                     lim = ws.cell(row=r, column=4).value
                     val = ws.cell(row=r, column=5).value
                     pct = ws.cell(row=r, column=6).value
-                    blank_line = _is_blank(b) and _is_blank(c) and _is_blank(lim) and _is_blank(val) and _is_blank(pct)
                 else:
                     lim = None
                     val = ws.cell(row=r, column=4).value
                     pct = ws.cell(row=r, column=5).value
-                    blank_line = _is_blank(b) and _is_blank(c) and _is_blank(val) and _is_blank(pct)
 
-                if blank_line:
+                # B is tested inline first: data rows nearly always have a label.
+                c_blank = is_blank(c)
+                if (
+                    (b is None or (type(b) is str and not b.strip()))
+                    and c_blank
+                    and is_blank(lim)
+                    and is_blank(val)
+                    and is_blank(pct)
+                ):
                     break
 
                 # Forward fill issue if blanks are used for visual grouping
-                if _is_blank(c) and last_issue is not None:
-                    c = last_issue
+                if c_blank:
+                    if last_issue is not None:
+                        c = last_issue
                 else:
-                    if not _is_blank(c):
-                        last_issue = c
+                    last_issue = c
 
-                records.append(
+                add_record(
                     {
                         "CaseType": case_type,
                         "CTGLabel": b,
@@ -482,8 +485,8 @@ def build_batch_comparison_workbook(
         raise ValueError("Missing source workbook path (src_workbook / workbook_path).")
 
     # pairs can be empty -> build a workbook with only Straight Comparison.
-    wb = Workbook()
-    wb.remove(wb.active)
+    # Write-only: every sheet is streamed top-to-bottom, so no in-memory cell grid.
+    wb = Workbook(write_only=True)
 
     used_names: set[str] = set()
 
@@ -554,7 +557,7 @@ def build_batch_comparison_workbook(
 
     if not wb.sheetnames:
         ws = wb.create_sheet("Comparison")
-        ws.cell(row=1, column=1).value = "No comparison data was available."
+        ws.append(["No comparison data was available."])
 
     wb.save(output_path)
     return output_path
@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Iterable
+from typing import Dict, FrozenSet, List, Mapping, Tuple, Iterable
 import re
 
 
@@ -17,6 +17,15 @@ class RankedTopic:
     hits: List[Tuple[int, int]]  # (start_idx, end_idx) in normalized flattened topic text
 
 
+@dataclass(frozen=True)
+class PreparedTopic:
+    """Normalized title/body text and token sets of one topic, built once per corpus."""
+    title_norm: str
+    title_tokens: FrozenSet[str]
+    body_norm: str
+    body_tokens: FrozenSet[str]
+
+
 _WORD_RE = re.compile(r"[A-Za-z0-9_']+")
 _WS_RE = re.compile(r"\s+")
 
@@ -59,13 +68,21 @@ def _find_hits(text_norm: str, query_tokens: List[str]) -> List[Tuple[int, int]]
     return sorted(set(hits), key=lambda x: (x[0], x[1]))
 
 
-def _score_topic(query_tokens: List[str], topic_title: str, blocks: Iterable[Tuple[str, str]]) -> RankedTopic:
-    title_norm = _normalize(topic_title)
+def _prepare_topic(topic_title: str, blocks: Iterable[Tuple[str, str]]) -> PreparedTopic:
     body_flat = _flatten_blocks(blocks)
-    body_norm = _normalize(body_flat)
+    return PreparedTopic(
+        title_norm=_normalize(topic_title),
+        title_tokens=frozenset(_tokenize(topic_title)),
+        body_norm=_normalize(body_flat),
+        body_tokens=frozenset(_tokenize(body_flat)),
+    )
+
 
-    title_tokens = set(_tokenize(topic_title))
-    body_tokens = set(_tokenize(body_flat))
+def _score_topic(query_tokens: List[str], topic_title: str, prepared: PreparedTopic) -> RankedTopic:
+    title_norm = prepared.title_norm
+    body_norm = prepared.body_norm
+    title_tokens = prepared.title_tokens
+    body_tokens = prepared.body_tokens
 
     score = 0.0
 
@@ -94,18 +111,18 @@ def _score_topic(query_tokens: List[str], topic_title: str, blocks: Iterable[Tup
     return RankedTopic(topic=topic_title, score=score, hits=hits)
 
 
-def _rt(query: str, topic_to_blocks: Dict[str, List[Tuple[str, str]]], *, limit: int = 25, min_score: float = 0.01):
+def _rt(query: str, prepared: Mapping[str, PreparedTopic], *, limit: int = 25, min_score: float = 0.01):
     q_norm = _normalize(query)
     if not q_norm:
-        return [RankedTopic(t, 0.0, []) for t in list(topic_to_blocks.keys())[:limit]]
+        return [RankedTopic(t, 0.0, []) for t in list(prepared.keys())[:limit]]
 
     q_tokens = _tokenize(q_norm)
     if not q_tokens:
-        return [RankedTopic(t, 0.0, []) for t in list(topic_to_blocks.keys())[:limit]]
+        return [RankedTopic(t, 0.0, []) for t in list(prepared.keys())[:limit]]
 
     ranked: List[RankedTopic] = []
-    for topic, blocks in topic_to_blocks.items():
-        r = _score_topic(q_tokens, topic, blocks)
+    for topic, p in prepared.items():
+        r = _score_topic(q_tokens, topic, p)
         if r.score >= min_score:
             ranked.append(r)
 
@@ -128,4 +145,24 @@ def rank_topics(
     limit: int = 25,
     min_score: float = 0.01,
 ) -> List[RankedTopic]:
-    return _rt(query, topic_to_blocks, limit=limit, min_score=min_score)
+    return _rt(query, prepare_topics(topic_to_blocks), limit=limit, min_score=min_score)
+
+
+def prepare_topics(topic_to_blocks: Mapping[str, Iterable[Tuple[str, str]]]) -> Dict[str, PreparedTopic]:
+    """
+    Normalize and tokenize every topic once. Pass the result to
+    rank_prepared to rank many queries against static help content without
+    re-flattening and re-lowercasing it per query.
+    """
+    return {topic: _prepare_topic(topic, blocks) for topic, blocks in topic_to_blocks.items()}
+
+
+def rank_prepared(
+    query: str,
+    prepared: Mapping[str, PreparedTopic],
+    *,
+    limit: int = 25,
+    min_score: float = 0.01,
+) -> List[RankedTopic]:
+    """Same ranking as rank_topics, over a corpus from prepare_topics."""
+    return _rt(query, prepared, limit=limit, min_score=min_score)
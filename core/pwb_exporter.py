@@ -1,7 +1,6 @@
 # core/pwb_exporter.py
 
 import os
-import win32com.client
 
 
 def export_violation_ctg(pwb_path: str, log_func) -> str:
@@ -16,6 +15,10 @@ def export_violation_ctg(pwb_path: str, log_func) -> str:
         RuntimeError on PowerWorld/SimAuto errors.
     """
 
+    # pywin32 is only needed to talk to SimAuto; importing it here keeps the
+    # CSV post-processing in core.case_processor usable (and testable) without it.
+    import win32com.client
+
     base, _ = os.path.splitext(pwb_path)
     csv_out = base + "_ViolationCTG.csv"
 
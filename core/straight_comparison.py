@@ -21,10 +21,13 @@ import os
 
 import pandas as pd
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
+from core.batch_sheet_writer import BOLD_FONT, CELL_ALIGN_RIGHT, is_blank as _is_blank
 from core.case_types import (
     CANONICAL_TO_PRETTY,
     PRETTY_CASE_TITLES,
@@ -44,14 +47,6 @@ PARSED_COLUMNS = [
 # Parsing the formatted scenario sheets (FAST iter_rows version)
 # ---------------------------------------------------------------------------
 
-def _is_blank(v) -> bool:
-    if v is None:
-        return True
-    if isinstance(v, str) and v.strip() == "":
-        return True
-    return False
-
-
 def _header_has_limit_from_row(d_val) -> bool:
     if isinstance(d_val, str) and "limit" in d_val.strip().lower():
         return True
@@ -69,6 +64,11 @@ def _parse_scenario_sheet(ws: Worksheet, log_func=None) -> pd.DataFrame:
     """
     records: List[Dict] = []
 
+    # Bind hot-loop lookups to locals (avoids global/attribute lookups per row)
+    to_canonical = PRETTY_TO_CANONICAL.get
+    is_blank = _is_blank
+    add_record = records.append
+
     current_case_type = None
     skip_rows = 0
     last_issue = None
@@ -80,7 +80,7 @@ def _parse_scenario_sheet(ws: Worksheet, log_func=None) -> pd.DataFrame:
         if current_case_type is None:
             if isinstance(b, str) and b.strip():
                 pretty = b.strip()
-                current_case_type = PRETTY_TO_CANONICAL.get(pretty, pretty)
+                current_case_type = to_canonical(pretty, pretty)
                 skip_rows = 1  # next row is header
                 last_issue = None
                 has_limit = None
@@ -94,29 +94,27 @@ def _parse_scenario_sheet(ws: Worksheet, log_func=None) -> pd.DataFrame:
             continue
 
         # End of block condition: blank line across expected columns
-        if has_limit:
-            # NEW: B,C,D,E,F must all be blank to end
-            if _is_blank(b) and _is_blank(c) and _is_blank(d) and _is_blank(e) and _is_blank(f):
-                current_case_type = None
-                skip_rows = 0
-                last_issue = None
-                has_limit = None
-                continue
-        else:
-            # OLD: B,C,D,E blank to end
-            if _is_blank(b) and _is_blank(c) and _is_blank(d) and _is_blank(e):
-                current_case_type = None
-                skip_rows = 0
-                last_issue = None
-                has_limit = None
-                continue
+        # (OLD: B..E, NEW: B..F). Data rows nearly always carry a contingency
+        # label, so B is tested inline and short-circuits the rest.
+        if (
+            (b is None or (type(b) is str and not b.strip()))
+            and is_blank(c)
+            and is_blank(d)
+            and is_blank(e)
+            and (not has_limit or is_blank(f))
+        ):
+            current_case_type = None
+            skip_rows = 0
+            last_issue = None
+            has_limit = None
+            continue
 
         # Forward fill issue if missing
-        if _is_blank(c) and last_issue is not None:
-            c = last_issue
+        if is_blank(c):
+            if last_issue is not None:
+                c = last_issue
         else:
-            if not _is_blank(c):
-                last_issue = c
+            last_issue = c
 
         if has_limit:
             lim = d
@@ -125,7 +123,7 @@ def _parse_scenario_sheet(ws: Worksheet, log_func=None) -> pd.DataFrame:
             lim = None
             pct = e
 
-        records.append(
+        add_record(
             {
                 "CaseType": current_case_type,
                 "CTGLabel": b,
@@ -141,6 +139,16 @@ def _parse_scenario_sheet(ws: Worksheet, log_func=None) -> pd.DataFrame:
     return df
 
 
+def _has_case_title(ws, scan_rows: int) -> bool:
+    """True if a case-type title appears in column B within the first scan_rows rows."""
+    # Read-only sheets stream their XML lazily, so stopping at the first hit
+    # also stops parsing the rest of the sheet.
+    for (b_val,) in ws.iter_rows(min_row=1, max_row=scan_rows, min_col=2, max_col=2, values_only=True):
+        if isinstance(b_val, str) and b_val.strip() in PRETTY_CASE_TITLES:
+            return True
+    return False
+
+
 def discover_scenario_sheets(workbook_path: str, log_func=None, scan_rows: int = 300) -> List[str]:
     """
     FAST scenario sheet discovery:
@@ -153,22 +161,16 @@ def discover_scenario_sheets(workbook_path: str, log_func=None, scan_rows: int =
     wb = load_workbook(workbook_path, read_only=True, data_only=True)
 
     found: List[str] = []
-    for name in wb.sheetnames:
-        try:
-            ws = wb[name]
-            hit = False
-            for (b_val,) in ws.iter_rows(min_row=1, max_row=scan_rows, min_col=2, max_col=2, values_only=True):
-                if isinstance(b_val, str):
-                    s = b_val.strip()
-                    if s in PRETTY_CASE_TITLES:
-                        hit = True
-                        break
-            if hit:
-                found.append(name)
-        except Exception:
-            continue
+    try:
+        for name in wb.sheetnames:
+            try:
+                if _has_case_title(wb[name], scan_rows):
+                    found.append(name)
+            except Exception:
+                continue
+    finally:
+        wb.close()
 
-    wb.close()
     if log_func:
         log_func(f"Discovered {len(found)} scenario sheets for Straight Comparison (fast scan).")
     return found
@@ -178,15 +180,7 @@ def discover_scenario_sheets(workbook_path: str, log_func=None, scan_rows: int =
 # Build a straight comparison dataframe (loads workbook ONCE)
 # ---------------------------------------------------------------------------
 
-def _safe_float(x):
-    try:
-        if x is None:
-            return None
-        if isinstance(x, float) and math.isnan(x):
-            return None
-        return float(x)
-    except Exception:
-        return None
+_KEY_COLUMNS = ["CaseTypePretty", "Contingency", "ResultingIssue"]
 
 
 def build_straight_comparison_df(
@@ -242,28 +236,28 @@ def build_straight_comparison_df(
 
         df["CaseTypePretty"] = df["CaseType"].map(CANONICAL_TO_PRETTY).fillna(df["CaseType"])
         df = df.rename(columns={"CTGLabel": "Contingency", "LimViolID": "ResultingIssue"})
-        df[col_label] = df["LimViolPct"].apply(_safe_float)
+        df[col_label] = pd.to_numeric(df["LimViolPct"], errors="coerce")
 
         # Keep limit as a display value (can be numeric or text)
         df["Limit"] = df.get("LimViolLimit")
 
+        # groupby() drops rows with a missing key; keep that behaviour.
+        df = df.dropna(subset=_KEY_COLUMNS)[_KEY_COLUMNS + ["Limit", col_label]]
+        # Blank/whitespace limits -> NaN so "first" (which skips NaN) picks the
+        # first non-blank value without a Python callback per group.
+        df["Limit"] = df["Limit"].replace(r"^\s*$", float("nan"), regex=True)
+
         # Collapse duplicates by max pct within this scenario.
         # For Limit, take the first non-blank value encountered.
-        def _first_nonblank(s: pd.Series):
-            for v in s.tolist():
-                if v is None:
-                    continue
-                if isinstance(v, float) and math.isnan(v):
-                    continue
-                if isinstance(v, str) and v.strip() == "":
-                    continue
-                return v
-            return None
-
-        df = (
-            df.groupby(["CaseTypePretty", "Contingency", "ResultingIssue"], as_index=False)
-              .agg({"Limit": _first_nonblank, col_label: "max"})
-        )
+        # Parsed sheets rarely repeat a key, so only the duplicated rows are grouped.
+        dup_mask = df.duplicated(subset=_KEY_COLUMNS, keep=False)
+        if dup_mask.any():
+            collapsed = (
+                df[dup_mask]
+                .groupby(_KEY_COLUMNS, as_index=False)
+                .agg({"Limit": "first", col_label: "max"})
+            )
+            df = pd.concat([df[~dup_mask], collapsed], ignore_index=True)
 
         if master is None:
             master = df
@@ -271,7 +265,7 @@ def build_straight_comparison_df(
             merged = pd.merge(
                 master,
                 df,
-                on=["CaseTypePretty", "Contingency", "ResultingIssue"],
+                on=_KEY_COLUMNS,
                 how="outer",
                 suffixes=("", "__new"),
             )
@@ -292,10 +286,10 @@ def build_straight_comparison_df(
     case_cols = [c for c in labels if c in master.columns]
 
     if case_cols:
+        # Threshold first, so only surviving rows carry a sort key and get sorted.
         max_series = master[case_cols].max(axis=1, skipna=True)
-        master = master[max_series.fillna(float("-inf")) >= float(threshold)].copy()
-
-        master["_SortKey"] = max_series
+        keep = max_series.fillna(float("-inf")) >= float(threshold)
+        master = master.loc[keep].assign(_SortKey=max_series.loc[keep])
         master = master.sort_values(
             by=["CaseType", "_SortKey"], ascending=[True, False], na_position="last"
         ).drop(columns=["_SortKey"])
@@ -329,46 +323,70 @@ CELL_ALIGN_WRAP = Alignment(wrap_text=True, vertical="top")
 CELL_ALIGN_CENTER = Alignment(horizontal="center", vertical="center", wrap_text=True)
 
 
-def _apply_table_styles(ws: Worksheet, num_cases: int):
-    ws.column_dimensions[get_column_letter(2)].width = 45  # B: Contingency
-    ws.column_dimensions[get_column_letter(3)].width = 45  # C: Issue
-    ws.column_dimensions[get_column_letter(4)].width = 15  # D: Limit
+# Fixed column widths, keyed by letter (resolved once at import)
+_FIXED_COLUMN_WIDTHS = (
+    ("B", 45),  # Contingency
+    ("C", 45),  # Issue
+    ("D", 15),  # Limit
+)
 
-    # Scenario % columns start at E now
-    for i in range(num_cases):
-        ws.column_dimensions[get_column_letter(5 + i)].width = 12
 
-    try:
-        ws.sheet_properties.outlinePr.summaryBelow = False
-        ws.sheet_properties.outlinePr.summaryRight = False
-        ws.sheet_properties.outlinePr.applyStyles = True
-    except Exception:
-        pass
+def _apply_table_styles(ws: Worksheet, num_cases: int):
+    for letter, width in _FIXED_COLUMN_WIDTHS:
+        ws.column_dimensions[letter].width = width
 
-    try:
-        ws.sheet_view.showOutlineSymbols = True
-    except Exception:
-        pass
+    # Scenario % columns start at E now
+    for col_idx in range(5, 5 + num_cases):
+        ws.column_dimensions[get_column_letter(col_idx)].width = 12
+
+    outline = getattr(getattr(ws, "sheet_properties", None), "outlinePr", None)
+    if outline is not None:
+        outline.summaryBelow = False
+        outline.summaryRight = False
+        outline.applyStyles = True
+
+    view = getattr(ws, "sheet_view", None)
+    if view is not None:
+        view.showOutlineSymbols = True
+
+
+def _styled_cell(ws: Worksheet, value, *, font=None, fill=None, border=None, alignment=None, number_format=None):
+    """Build a detached cell for ws.append() (works for normal and write-only sheets)."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if alignment is not None:
+        cell.alignment = alignment
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
 
 
 def _write_title_row(ws: Worksheet, row: int, title: str, last_col: int):
-    ws.merge_cells(start_row=row, start_column=2, end_row=row, end_column=last_col)
-    cell = ws.cell(row=row, column=2)
-    cell.value = title
-    cell.fill = TITLE_FILL
-    cell.font = TITLE_FONT
-    cell.alignment = CELL_ALIGN_CENTER
+    cell = _styled_cell(ws, title, font=TITLE_FONT, fill=TITLE_FILL, alignment=CELL_ALIGN_CENTER)
+    ws.append([None, cell])
+    ws.merged_cells.add(CellRange(min_col=2, min_row=row, max_col=last_col, max_row=row))
 
 
 def _write_header_row(ws: Worksheet, row: int, case_labels: Sequence[str]):
     headers = ["Contingency Events", "Resulting Issue", "Limit"] + list(case_labels)
-    for col_offset, header in enumerate(headers):
-        cell = ws.cell(row=row, column=2 + col_offset)
-        cell.value = header
-        cell.fill = HEADER_FILL
-        cell.font = HEADER_FONT
-        cell.alignment = CELL_ALIGN_CENTER
-        cell.border = THIN_BORDER
+    cells = [None]
+    for header in headers:
+        cells.append(
+            _styled_cell(
+                ws,
+                header,
+                font=HEADER_FONT,
+                fill=HEADER_FILL,
+                alignment=CELL_ALIGN_CENTER,
+                border=THIN_BORDER,
+            )
+        )
+    ws.append(cells)
 
 
 def _write_row(
@@ -379,39 +397,37 @@ def _write_row(
     outline_level: int = 0,
     hidden: bool = False,
     bold: bool = False,
+    collapsed: bool = False,
 ):
+    # Row dimensions must be in place before the row is appended: write-only
+    # sheets stream the <row> element (with its attributes) immediately.
+    if outline_level or hidden or collapsed:
+        dims = ws.row_dimensions[row]
+        dims.outlineLevel = int(outline_level)
+        dims.hidden = bool(hidden)
+        if collapsed:
+            dims.collapsed = True
+
+    cells = [None]
     for col_offset, val in enumerate(values):
-        cell = ws.cell(row=row, column=2 + col_offset)
-        cell.value = val
+        cell = WriteOnlyCell(ws, value=val)
         cell.border = THIN_BORDER
 
         if bold:
-            base = cell.font or Font()
-            cell.font = Font(
-                name=base.name,
-                size=base.size,
-                bold=True,
-                italic=base.italic,
-                vertAlign=base.vertAlign,
-                underline=base.underline,
-                strike=base.strike,
-                color=base.color,
-            )
+            cell.font = BOLD_FONT
 
         if col_offset in (0, 1):
             cell.alignment = CELL_ALIGN_WRAP
         else:
-            cell.alignment = Alignment(horizontal="right", vertical="top")
+            cell.alignment = CELL_ALIGN_RIGHT
 
         # Case % columns are now offsets >= 3
         if col_offset >= 3 and isinstance(val, (float, int)):
             cell.number_format = "0.00"
 
-    try:
-        ws.row_dimensions[row].outlineLevel = int(outline_level)
-        ws.row_dimensions[row].hidden = bool(hidden)
-    except Exception:
-        pass
+        cells.append(cell)
+
+    ws.append(cells)
 
 
 def _max_across_cases(row: pd.Series, case_cols: Sequence[str]) -> float:
@@ -437,11 +453,23 @@ def write_formatted_straight_sheet(
     *,
     expandable_issue_view: bool = True,
 ):
+    """
+    Create the Straight Comparison sheet: one blue block per case type, with
+    Contingency | Resulting Issue | Limit and one % column per scenario
+    (case_labels order). The top row per Resulting Issue is bolded and, with
+    expandable_issue_view, the other rows are grouped under it (+/-).
+
+    Rows are written top-to-bottom with ws.append(), so wb may be a
+    write-only workbook.
+    """
     ws = wb.create_sheet(title=ws_name)
     _apply_table_styles(ws, num_cases=len(case_labels))
 
+    # Row 1 stays empty; blocks start at row 2.
+    ws.append([])
+
     if df is None or df.empty:
-        ws.cell(row=2, column=2).value = "No rows above threshold."
+        ws.append([None, "No rows above threshold."])
         return
 
     current_row = 2
@@ -450,51 +478,49 @@ def write_formatted_straight_sheet(
     # Columns: B..(D + num_cases)  => last_col = 4 + num_cases
     last_col = 4 + len(case_cols)
 
+    # Fixed column order so rows can be unpacked from plain tuples
+    row_cols = ["Contingency", "ResultingIssue", "Limit"] + case_cols
+
     for case_type_pretty in CANONICAL_TO_PRETTY.values():
         sub = df[df["CaseType"] == case_type_pretty].copy()
         if sub.empty:
             continue
 
+        sub["Contingency"] = sub["Contingency"].fillna("").astype(str)
+        sub["ResultingIssue"] = sub["ResultingIssue"].fillna("").astype(str)
+
         _write_title_row(ws, current_row, case_type_pretty, last_col=last_col)
         current_row += 1
         _write_header_row(ws, current_row, case_cols)
         current_row += 1
 
         if not expandable_issue_view:
-            for _, r in sub.iterrows():
-                cont = str(r.get("Contingency", "") or "")
-                issue = str(r.get("ResultingIssue", "") or "")
-                limit = r.get("Limit", None)
-                vals = [cont, issue, limit] + [r.get(c, None) for c in case_cols]
+            for vals in sub[row_cols].itertuples(index=False, name=None):
                 _write_row(ws, current_row, vals)
                 current_row += 1
+            ws.append([])
             current_row += 1
             continue
 
         sub["_SortKey"] = sub.apply(lambda rr: _max_across_cases(rr, case_cols), axis=1)
-        group_max = sub.groupby("ResultingIssue")["_SortKey"].max().sort_values(ascending=False)
-        ordered_issues = list(group_max.index)
-
-        for issue_key in ordered_issues:
-            g = sub[sub["ResultingIssue"] == issue_key].copy()
-            if g.empty:
-                continue
 
-            g = g.sort_values(by="_SortKey", ascending=False, na_position="last")
+        # One stable sort: issues by their max desc (ties by name, matching the
+        # old sorted-groupby order), then rows within each issue by max desc.
+        sub["_IssueMax"] = sub.groupby("ResultingIssue", sort=False)["_SortKey"].transform("max")
+        sub = sub.sort_values(
+            by=["_IssueMax", "ResultingIssue", "_SortKey"],
+            ascending=[False, True, False],
+            kind="mergesort",
+        )
 
-            summary_row_index = None
+        for _issue_key, g in sub.groupby("ResultingIssue", sort=False):
+            # The summary row is streamed before its details, so decide up front.
+            has_details = len(g) > 1
             first = True
 
-            for _, r in g.iterrows():
-                cont = str(r.get("Contingency", "") or "")
-                issue = str(r.get("ResultingIssue", "") or "")
+            for cont, issue, limit, *case_vals in g[row_cols].itertuples(index=False, name=None):
                 issue_display = issue if first else ""
-                limit = r.get("Limit", None)
-
-                vals = [cont, issue_display, limit] + [r.get(c, None) for c in case_cols]
-
-                if first:
-                    summary_row_index = current_row
+                vals = [cont, issue_display, limit] + case_vals
 
                 _write_row(
                     ws,
@@ -503,14 +529,10 @@ def write_formatted_straight_sheet(
                     outline_level=0 if first else 1,
                     hidden=False if first else True,
                     bold=True if first else False,
+                    collapsed=first and has_details,
                 )
                 current_row += 1
                 first = False
 
-            try:
-                if summary_row_index is not None and len(g) > 1:
-                    ws.row_dimensions[summary_row_index].collapsed = True
-            except Exception:
-                pass
-
+        ws.append([])
         current_row += 1
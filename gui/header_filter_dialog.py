@@ -13,7 +13,8 @@ class HeaderFilterDialog(tk.Toplevel):
     def __init__(self, parent, headers, log_func):
         super().__init__(parent)
         self.title("Filter Columns from ViolationCTG Export")
-        self.headers = headers
+        # Stringified once; the listbox and the log both use these names.
+        self.headers = tuple(str(h) for h in headers)
         self.log_func = log_func
 
         self.geometry("450x400")
@@ -41,8 +42,7 @@ class HeaderFilterDialog(tk.Toplevel):
         scroll.pack(side=tk.RIGHT, fill=tk.Y)
         self.listbox.configure(yscrollcommand=scroll.set)
 
-        for h in headers:
-            self.listbox.insert(tk.END, str(h))
+        self.listbox.insert(tk.END, *self.headers)
 
         btn_frame = ttk.Frame(self)
         btn_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
@@ -61,7 +61,8 @@ class HeaderFilterDialog(tk.Toplevel):
 
         filtered = [self.headers[i] for i in indices]
 
-        self.log_func("\nUser-chosen filtered columns (to hide in future):")
-        for h in filtered:
-            self.log_func(f"  - {h}")
-        self.log_func("End of filtered column list.\n")
+        # One log call for the whole list; the log sink redraws per call.
+        lines = ["\nUser-chosen filtered columns (to hide in future):"]
+        lines.extend(f"  - {h}" for h in filtered)
+        lines.append("End of filtered column list.\n")
+        self.log_func("\n".join(lines))
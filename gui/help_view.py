@@ -8,13 +8,230 @@
 from __future__ import annotations
 
 import os
+import re
 import sys
 import subprocess
 import time
+from functools import lru_cache
+from typing import Mapping
+
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
+
+from core.help_search import prepare_topics, rank_prepared, probe
+
+
+# ---------------- Content model ---------------- #
+
+# Help content is static: built once at import and shared by every HelpTab,
+# instead of being rebuilt on each topic switch, search keystroke or copy.
+# topic -> ((kind, content), ...); tuples so nothing can mutate it in place.
+
+_FOLDER_TEMPLATE = """<WorkingFolder>\\
+  ├─ Cases\\              (.pwb files)
+  ├─ Exports\\            (raw ViolationCTG exports)
+  ├─ Filtered\\           (filtered outputs)
+  ├─ Comparisons\\        (Combined workbook + Batch outputs)
+  └─ Batch\\              (queued batch comparison outputs)
+"""
+
+_SECTIONS: Mapping[str, tuple[tuple[str, str], ...]] = {
+    "Overview": (
+        ("h1", "What this tool does"),
+        ("p", "Exports, filters, and compares PowerWorld ViolationCTG results in a repeatable format."),
+        ("h2", "Main features"),
+        ("bullet", "Case Processing: export ViolationCTG CSVs and produce filtered outputs"),
+        ("bullet", "Combined workbook: one sheet per scenario, blue-block formatted"),
+        ("bullet", "Compare Cases: Left vs Right with threshold + delta/status"),
+        ("bullet", "Batch workbook: one sheet per queued pair"),
+        ("bullet", "Straight Comparison: compares ALL original scenario sheets side-by-side"),
+        ("h2", "Recent updates you should know"),
+        ("bullet", "Expandable +/- issue grouping uses Excel outline (summary row ABOVE details)"),
+        ("bullet", "Batch workbook can be built with ONLY Straight Comparison (empty queue)"),
+        ("bullet", "Limit / MVA / % fields can be rounded to 1 decimal (when enabled in the build step)"),
+        ("callout", "Sharing tip: send coworkers the Batch workbook—it's self-contained."),
+    ),
+
+    "Files you need": (
+        ("h1", "Files you need"),
+        ("h2", "Inputs"),
+        ("bullet", ".pwb (only required when exporting via SimAuto)"),
+        ("bullet", "ViolationCTG CSV exports (supported even if exported outside this tool)"),
+        ("bullet", "Combined comparison workbook (.xlsx) used by Compare Cases"),
+        ("h2", "Outputs created by the tool"),
+        ("bullet", "*_Filtered.csv (filtered export)"),
+        ("bullet", "Combined_ViolationCTG_Comparison.xlsx"),
+        ("bullet", "Batch comparison workbook (.xlsx) with pair sheets + Straight Comparison"),
+        ("callout", "If Excel has a file open, Windows may lock it. Close Excel before rerunning."),
+    ),
+
+    "Recommended folder setup": (
+        ("h1", "Recommended folder setup"),
+        ("p", "Keeping a clean folder structure makes runs faster and outputs easier to find."),
+        ("h2", "Template"),
+        ("code", _FOLDER_TEMPLATE),
+        ("h2", "Why this helps"),
+        ("bullet", "Faster reads/writes (local > network share)"),
+        ("bullet", "Easy to locate outputs when someone asks for results"),
+        ("bullet", "Reduces accidental exports into random locations"),
+        ("callout", "Best practice: one working folder per study."),
+    ),
+
+    "Quick start: Case Processing": (
+        ("h1", "Quick start: Case Processing"),
+        ("callout", "Goal: produce clean, consistent filtered exports for comparison."),
+        ("h2", "Steps"),
+        ("num", "1) Select the working folder."),
+        ("num", "2) Export ViolationCTG (SimAuto) or point at existing CSV exports."),
+        ("num", "3) Apply filters (LimViolCat + optional LimViolID max behavior depending on your pipeline)."),
+        ("num", "4) Confirm outputs saved under Filtered/."),
+        ("h2", "Common pitfalls"),
+        ("bullet", "SimAuto export requires PowerWorld installed and available"),
+        ("bullet", "Close CSV/Excel outputs before rerunning (file locks)"),
+    ),
+
+    "Quick start: Compare Cases": (
+        ("h1", "Quick start: Compare Cases"),
+        ("callout", "Goal: see what got better/worse between two scenarios."),
+        ("h2", "Steps"),
+        ("num", "1) Open the combined workbook (.xlsx)."),
+        ("num", "2) Pick Left and Right sheets."),
+        ("num", "3) Set threshold (example: 80%). Rows below threshold are omitted."),
+        ("num", "4) Click Compare."),
+        ("h2", "Queue tools"),
+        ("bullet", "Add to queue: store the current Left vs Right pair"),
+        ("bullet", "Delete selected: remove highlighted queued entries"),
+        ("bullet", "Clear all: wipe queue and start fresh"),
+        ("bullet", "Build queued workbook: exports a new .xlsx with one sheet per pair"),
+        ("callout", "Delta column shows numeric change or 'Only in left/right' when missing on one side."),
+    ),
+
+    "Straight Comparison (all scenarios)": (
+        ("h1", "Straight Comparison (all scenarios)"),
+        ("p", "This sheet compares ALL original scenario sheets side-by-side (no pair deltas)."),
+        ("h2", "What it includes"),
+        ("bullet", "Blue-block case type sections (ACCA LongTerm / ACCA / DCwAC / AUXapplied)"),
+        ("bullet", "One column per scenario (sheet)"),
+        ("bullet", "Threshold applies to the max across scenarios"),
+        ("bullet", "+/- outline grouping can collapse by Resulting Issue (optional)"),
+        ("h2", "When to use it"),
+        ("bullet", "Spot the 'worst anywhere' issues across many scenarios quickly"),
+        ("bullet", "Share a single sheet for broad review"),
+    ),
+
+    "Batch compare workflow": (
+        ("h1", "Batch compare workflow"),
+        ("callout", "Best way to package results for coworkers."),
+        ("h2", "Workflow"),
+        ("num", "1) Load the combined workbook."),
+        ("num", "2) Add needed Left vs Right pairs to the queue (optional)."),
+        ("num", "3) Build batch workbook."),
+        ("num", "4) Batch workbook includes pair sheets + Straight Comparison (when available)."),
+        ("h2", "Naming suggestion"),
+        ("code", "Batch_Comparison_<StudyName>.xlsx\nExample: Batch_Comparison_LTWG26W.xlsx"),
+    ),
+
+    "How the +/- grouping works": (
+        ("h1", "How the +/- grouping works"),
+        ("p", "The outline dropdown is Excel's row grouping feature."),
+        ("h2", "Behavior"),
+        ("bullet", "Rows are grouped by Resulting Issue"),
+        ("bullet", "The top (max) row is the summary row and stays visible"),
+        ("bullet", "Detail rows are hidden under the +/-"),
+        ("bullet", "Summary row is ABOVE details so the +/- appears at the top row (cleaner)"),
+        ("callout", "If you don't want grouping, turn off the 'expandable issue view' option."),
+    ),
+
+    "Performance tips": (
+        ("h1", "Performance tips"),
+        ("h2", "Best practices"),
+        ("bullet", "Work locally when possible (network shares can be slow)"),
+        ("bullet", "Avoid leaving giant workbooks open while building/exporting"),
+        ("bullet", "Batch in chunks if you have hundreds of pairs"),
+        ("callout", "The UI may look briefly 'stuck' during heavy Excel I/O — that’s normal."),
+    ),
+
+    "Troubleshooting": (
+        ("h1", "Troubleshooting"),
+        ("h2", "File locked / permission denied"),
+        ("bullet", "Close the workbook/CSV in Excel and rerun."),
+        ("h2", "No workbook loaded"),
+        ("bullet", "Open an .xlsx before Compare/Batch actions work."),
+        ("h2", "No sheets detected"),
+        ("bullet", "Workbook may be protected/corrupt or not a normal Excel workbook."),
+        ("h2", "Export issues (SimAuto)"),
+        ("bullet", "Confirm PowerWorld is installed and SimAuto is available."),
+        ("callout", "If you're stuck: copy the Compare Log and send it to the tool owner."),
+    ),
+
+    "Version / Contact": (
+        ("h1", "Version / Contact"),
+        ("p", "Tool name: Contingency Comparator"),
+        ("p", "Purpose: PowerWorld ViolationCTG export + compare"),
+        ("p", "Version: v2.x"),
+        ("code", "Team: Transmission Planning\nNotes: TBD"),
+    ),
+}
+
+# Block kinds copied as their (stripped) text; bullets get "- ", nums as-is.
+_PLAIN_KINDS = frozenset(("h1", "h2", "p", "muted", "code", "callout"))
+
+
+def _plain_lines(topic: str, blocks) -> list[str]:
+    """Plain-text lines for one topic (title, underline, then its blocks) for copying."""
+    lines = [topic, "-" * len(topic)]
+    add = lines.append
+    for kind, content in blocks:
+        if kind in _PLAIN_KINDS:
+            add(str(content).strip())
+        elif kind == "bullet":
+            add(f"- {content}")
+        elif kind == "num":
+            add(content)
+    return lines
+
+
+_DIVIDER_ARGS = ("────────────────────────────────────────\n", "divider")
+
+
+def _render_args(blocks) -> tuple:
+    """Flat (chars, tags, chars, tags, ...) Text.insert arguments for a topic, divider included."""
+    args = []
+    add = args.extend
+    for kind, content in blocks:
+        if kind in ("h1", "h2", "p", "muted", "num"):
+            add((content + "\n", kind))
+        elif kind == "bullet":
+            add(("• " + content + "\n", "bullet"))
+        elif kind in ("code", "callout"):
+            add((content.strip() + "\n", kind))
+        else:
+            add((str(content) + "\n", "p"))
+
+        # blank spacer line; an empty tag list keeps it untagged
+        add(("\n", ()))
 
-from core.help_search import rank_topics, probe
+    args.extend(_DIVIDER_ARGS)
+    return tuple(args)
+
+
+# Normalized search text per topic, so ranking a keystroke doesn't re-flatten
+# and re-lowercase the whole help content.
+_SEARCH_CORPUS = prepare_topics(_SECTIONS)
+
+
+@lru_cache(maxsize=128)
+def _ranked_topics(query: str, limit: int) -> tuple[str, ...]:
+    """Ranked topic titles for a query; the corpus is static, so results never go stale."""
+    return tuple(r.topic for r in rank_prepared(query, _SEARCH_CORPUS, limit=limit))
+
+
+# The content is static, so bullet prefixes and code/callout stripping are
+# done once here rather than whenever the help tab is built.
+_RENDERED: Mapping[str, tuple] = {
+    topic: _render_args(blocks) for topic, blocks in _SECTIONS.items()
+}
 
 
 class HelpTab(ttk.Frame):
@@ -29,10 +246,29 @@ class HelpTab(ttk.Frame):
     DIVIDER = "#D6DFEA"
     HILITE_BG = "#FFF2A8"
 
+    # Typing pause before the topic list is re-ranked.
+    SEARCH_DELAY_MS = 140
+
     def __init__(self, master):
         super().__init__(master)
         self._current_topic = "Overview"
         self._topics_master: list[str] = []
+        # Topics currently in the Listbox, by row, so selection handlers
+        # don't have to read the items back from Tk.
+        self._listed_topics: tuple[str, ...] = ()
+        self._topic_to_index: dict[str, int] = {}
+        # Latest topic picked in the Listbox, rendered on the next idle pass
+        # so a burst of selections (held arrow key) shows only the last one.
+        self._pending_topic: str | None = None
+        self._pending_render = None
+        self._search_after_id = None
+        # Clipboard text per topic / for "Copy all", built on first copy.
+        # The content is static, so these never need invalidating.
+        self._plain_cache: dict[str, str] = {}
+        self._all_plain: str | None = None
+        # (startline, endline) of each topic in the Text, which holds every
+        # topic at once; switching topics only changes the visible range.
+        self._topic_lines: dict[str, tuple[int, int]] = {}
         self._egg_lock_path = self._get_lock_path()
         self._build_gui()
 
@@ -112,8 +348,9 @@ class HelpTab(ttk.Frame):
         ]
         self._topics_master = list(self._topics)
 
-        for t in self._topics_master:
-            self.topic_list.insert(tk.END, t)
+        self.topic_list.insert(tk.END, *self._topics_master)
+        self._listed_topics = tuple(self._topics_master)
+        self._topic_to_index = {t: i for i, t in enumerate(self._listed_topics)}
 
         # RIGHT: content area
         right = ttk.Frame(outer)
@@ -167,6 +404,7 @@ class HelpTab(ttk.Frame):
         self.text.configure(yscrollcommand=scroll.set)
 
         self._configure_text_tags()
+        self._render_all_topics()
 
         # Footer hint
         footer = ttk.Frame(right)
@@ -183,30 +421,47 @@ class HelpTab(ttk.Frame):
         self._select_topic("Overview")
         self._render_topic("Overview")
 
+    def _get_tag_fonts(self) -> dict[str, tkfont.Font]:
+        """
+        Named fonts for the text tags. Fonts belong to a Tk interpreter, so they
+        are kept on this widget's root and shared only by HelpTabs under it.
+        """
+        root = self._root()
+        fonts = getattr(root, "_help_tag_fonts", None)
+        if fonts is None:
+            fonts = root._help_tag_fonts = {
+                "h1": tkfont.Font(root, family="Segoe UI", size=13, weight="bold"),
+                "h2": tkfont.Font(root, family="Segoe UI", size=11, weight="bold"),
+                "body": tkfont.Font(root, family="Segoe UI", size=10),
+                "code": tkfont.Font(root, family="Consolas", size=10),
+            }
+        return fonts
+
     def _configure_text_tags(self):
+        fonts = self._get_tag_fonts()
         self.text.tag_configure(
             "h1",
-            font=("Segoe UI", 13, "bold"),
+            font=fonts["h1"],
             foreground=self.NAVY_2,
             spacing1=8,
             spacing3=6,
         )
         self.text.tag_configure(
             "h2",
-            font=("Segoe UI", 11, "bold"),
+            font=fonts["h2"],
             foreground=self.TEXT,
             spacing1=10,
             spacing3=4,
         )
-        self.text.tag_configure("p", font=("Segoe UI", 10), foreground=self.TEXT, spacing1=2, spacing3=4)
-        self.text.tag_configure("muted", font=("Segoe UI", 10), foreground=self.MUTED)
+        self.text.tag_configure("p", font=fonts["body"], foreground=self.TEXT, spacing1=2, spacing3=4)
+        self.text.tag_configure("muted", font=fonts["body"], foreground=self.MUTED)
 
-        self.text.tag_configure("bullet", font=("Segoe UI", 10), lmargin1=22, lmargin2=42, spacing3=2)
-        self.text.tag_configure("num", font=("Segoe UI", 10), lmargin1=22, lmargin2=42, spacing3=2)
+        self.text.tag_configure("bullet", font=fonts["body"], lmargin1=22, lmargin2=42, spacing3=2)
+        self.text.tag_configure("num", font=fonts["body"], lmargin1=22, lmargin2=42, spacing3=2)
 
         self.text.tag_configure(
             "callout",
-            font=("Segoe UI", 10),
+            font=fonts["body"],
             background=self.CALLOUT_BG,
             lmargin1=12,
             lmargin2=12,
@@ -215,7 +470,7 @@ class HelpTab(ttk.Frame):
         )
         self.text.tag_configure(
             "code",
-            font=("Consolas", 10),
+            font=fonts["code"],
             background=self.CODE_BG,
             lmargin1=12,
             lmargin2=12,
@@ -229,169 +484,25 @@ class HelpTab(ttk.Frame):
         # make read-only but selectable
         self.text.configure(state="disabled")
 
-    # ---------------- Content model ---------------- #
-
-    def _folder_template(self) -> str:
-        return """<WorkingFolder>\\
-  ├─ Cases\\              (.pwb files)
-  ├─ Exports\\            (raw ViolationCTG exports)
-  ├─ Filtered\\           (filtered outputs)
-  ├─ Comparisons\\        (Combined workbook + Batch outputs)
-  └─ Batch\\              (queued batch comparison outputs)
-"""
-
-    def _get_sections(self):
-        return {
-            "Overview": [
-                ("h1", "What this tool does"),
-                ("p", "Exports, filters, and compares PowerWorld ViolationCTG results in a repeatable format."),
-                ("h2", "Main features"),
-                ("bullet", "Case Processing: export ViolationCTG CSVs and produce filtered outputs"),
-                ("bullet", "Combined workbook: one sheet per scenario, blue-block formatted"),
-                ("bullet", "Compare Cases: Left vs Right with threshold + delta/status"),
-                ("bullet", "Batch workbook: one sheet per queued pair"),
-                ("bullet", "Straight Comparison: compares ALL original scenario sheets side-by-side"),
-                ("h2", "Recent updates you should know"),
-                ("bullet", "Expandable +/- issue grouping uses Excel outline (summary row ABOVE details)"),
-                ("bullet", "Batch workbook can be built with ONLY Straight Comparison (empty queue)"),
-                ("bullet", "Limit / MVA / % fields can be rounded to 1 decimal (when enabled in the build step)"),
-                ("callout", "Sharing tip: send coworkers the Batch workbook—it's self-contained."),
-            ],
-
-            "Files you need": [
-                ("h1", "Files you need"),
-                ("h2", "Inputs"),
-                ("bullet", ".pwb (only required when exporting via SimAuto)"),
-                ("bullet", "ViolationCTG CSV exports (supported even if exported outside this tool)"),
-                ("bullet", "Combined comparison workbook (.xlsx) used by Compare Cases"),
-                ("h2", "Outputs created by the tool"),
-                ("bullet", "*_Filtered.csv (filtered export)"),
-                ("bullet", "Combined_ViolationCTG_Comparison.xlsx"),
-                ("bullet", "Batch comparison workbook (.xlsx) with pair sheets + Straight Comparison"),
-                ("callout", "If Excel has a file open, Windows may lock it. Close Excel before rerunning."),
-            ],
-
-            "Recommended folder setup": [
-                ("h1", "Recommended folder setup"),
-                ("p", "Keeping a clean folder structure makes runs faster and outputs easier to find."),
-                ("h2", "Template"),
-                ("code", self._folder_template()),
-                ("h2", "Why this helps"),
-                ("bullet", "Faster reads/writes (local > network share)"),
-                ("bullet", "Easy to locate outputs when someone asks for results"),
-                ("bullet", "Reduces accidental exports into random locations"),
-                ("callout", "Best practice: one working folder per study."),
-            ],
-
-            "Quick start: Case Processing": [
-                ("h1", "Quick start: Case Processing"),
-                ("callout", "Goal: produce clean, consistent filtered exports for comparison."),
-                ("h2", "Steps"),
-                ("num", "1) Select the working folder."),
-                ("num", "2) Export ViolationCTG (SimAuto) or point at existing CSV exports."),
-                ("num", "3) Apply filters (LimViolCat + optional LimViolID max behavior depending on your pipeline)."),
-                ("num", "4) Confirm outputs saved under Filtered/."),
-                ("h2", "Common pitfalls"),
-                ("bullet", "SimAuto export requires PowerWorld installed and available"),
-                ("bullet", "Close CSV/Excel outputs before rerunning (file locks)"),
-            ],
-
-            "Quick start: Compare Cases": [
-                ("h1", "Quick start: Compare Cases"),
-                ("callout", "Goal: see what got better/worse between two scenarios."),
-                ("h2", "Steps"),
-                ("num", "1) Open the combined workbook (.xlsx)."),
-                ("num", "2) Pick Left and Right sheets."),
-                ("num", "3) Set threshold (example: 80%). Rows below threshold are omitted."),
-                ("num", "4) Click Compare."),
-                ("h2", "Queue tools"),
-                ("bullet", "Add to queue: store the current Left vs Right pair"),
-                ("bullet", "Delete selected: remove highlighted queued entries"),
-                ("bullet", "Clear all: wipe queue and start fresh"),
-                ("bullet", "Build queued workbook: exports a new .xlsx with one sheet per pair"),
-                ("callout", "Delta column shows numeric change or 'Only in left/right' when missing on one side."),
-            ],
-
-            "Straight Comparison (all scenarios)": [
-                ("h1", "Straight Comparison (all scenarios)"),
-                ("p", "This sheet compares ALL original scenario sheets side-by-side (no pair deltas)."),
-                ("h2", "What it includes"),
-                ("bullet", "Blue-block case type sections (ACCA LongTerm / ACCA / DCwAC / AUXapplied)"),
-                ("bullet", "One column per scenario (sheet)"),
-                ("bullet", "Threshold applies to the max across scenarios"),
-                ("bullet", "+/- outline grouping can collapse by Resulting Issue (optional)"),
-                ("h2", "When to use it"),
-                ("bullet", "Spot the 'worst anywhere' issues across many scenarios quickly"),
-                ("bullet", "Share a single sheet for broad review"),
-            ],
-
-            "Batch compare workflow": [
-                ("h1", "Batch compare workflow"),
-                ("callout", "Best way to package results for coworkers."),
-                ("h2", "Workflow"),
-                ("num", "1) Load the combined workbook."),
-                ("num", "2) Add needed Left vs Right pairs to the queue (optional)."),
-                ("num", "3) Build batch workbook."),
-                ("num", "4) Batch workbook includes pair sheets + Straight Comparison (when available)."),
-                ("h2", "Naming suggestion"),
-                ("code", "Batch_Comparison_<StudyName>.xlsx\nExample: Batch_Comparison_LTWG26W.xlsx"),
-            ],
-
-            "How the +/- grouping works": [
-                ("h1", "How the +/- grouping works"),
-                ("p", "The outline dropdown is Excel's row grouping feature."),
-                ("h2", "Behavior"),
-                ("bullet", "Rows are grouped by Resulting Issue"),
-                ("bullet", "The top (max) row is the summary row and stays visible"),
-                ("bullet", "Detail rows are hidden under the +/-"),
-                ("bullet", "Summary row is ABOVE details so the +/- appears at the top row (cleaner)"),
-                ("callout", "If you don't want grouping, turn off the 'expandable issue view' option."),
-            ],
-
-            "Performance tips": [
-                ("h1", "Performance tips"),
-                ("h2", "Best practices"),
-                ("bullet", "Work locally when possible (network shares can be slow)"),
-                ("bullet", "Avoid leaving giant workbooks open while building/exporting"),
-                ("bullet", "Batch in chunks if you have hundreds of pairs"),
-                ("callout", "The UI may look briefly 'stuck' during heavy Excel I/O — that’s normal."),
-            ],
-
-            "Troubleshooting": [
-                ("h1", "Troubleshooting"),
-                ("h2", "File locked / permission denied"),
-                ("bullet", "Close the workbook/CSV in Excel and rerun."),
-                ("h2", "No workbook loaded"),
-                ("bullet", "Open an .xlsx before Compare/Batch actions work."),
-                ("h2", "No sheets detected"),
-                ("bullet", "Workbook may be protected/corrupt or not a normal Excel workbook."),
-                ("h2", "Export issues (SimAuto)"),
-                ("bullet", "Confirm PowerWorld is installed and SimAuto is available."),
-                ("callout", "If you're stuck: copy the Compare Log and send it to the tool owner."),
-            ],
-
-            "Version / Contact": [
-                ("h1", "Version / Contact"),
-                ("p", "Tool name: Contingency Comparator"),
-                ("p", "Purpose: PowerWorld ViolationCTG export + compare"),
-                ("p", "Version: v2.x"),
-                ("code", "Team: Transmission Planning\nNotes: TBD"),
-            ],
-        }
-
     # ---------------- Search ---------------- #
 
     def _on_search_changed(self, _event=None):
+        # Re-rank once typing pauses instead of on every key release.
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.SEARCH_DELAY_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_after_id = None
         q = self.search_var.get().strip()
-        sections = self._get_sections()
 
         # secret trigger should fire only on Enter, not while typing
         if not q:
             self._set_topic_list(self._topics_master)
             return
 
-        ranked = rank_topics(q, sections, limit=50)
-        ordered = [r.topic for r in ranked]
+        # Ranking ignores case and extra spaces, so share cache entries across them.
+        ordered = list(_ranked_topics(" ".join(q.lower().split()), 50))
 
         # fallback: substring filter on titles
         if not ordered:
@@ -402,17 +513,20 @@ class HelpTab(ttk.Frame):
         self._set_topic_list(ordered if ordered else self._topics_master)
 
     def _on_search_enter(self, _event=None):
+        # Apply any pending re-rank first so the list matches the query.
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._run_search()
+
         q = self.search_var.get().strip()
 
         # secret trigger: only fires on Enter
         if probe(q):
             self._launch_hidden_tool_single_instance()
             return
-
-        sections = self._get_sections()
-        ranked = rank_topics(q, sections, limit=1)
+        ranked = _ranked_topics(" ".join(q.lower().split()), 1)
         if ranked:
-            topic = ranked[0].topic
+            topic = ranked[0]
             self._select_topic(topic)
             self._render_topic(topic)
             self._highlight_query_hits(q)
@@ -420,23 +534,27 @@ class HelpTab(ttk.Frame):
             self._highlight_query_hits(q)
 
     def _set_topic_list(self, topics):
+        listed = tuple(topics or ())
+        # Most keystrokes leave the ranking unchanged; keep the Listbox as is.
+        if listed == self._listed_topics:
+            return
         self.topic_list.delete(0, tk.END)
-        for t in topics:
-            self.topic_list.insert(tk.END, t)
+        self._listed_topics = listed
+        self._topic_to_index = {t: i for i, t in enumerate(self._listed_topics)}
         if topics:
+            self.topic_list.insert(tk.END, *topics)
             self.topic_list.selection_clear(0, tk.END)
             self.topic_list.selection_set(0)
             self.topic_list.activate(0)
 
     def _select_topic(self, topic: str):
-        items = self.topic_list.get(0, tk.END)
-        for i, t in enumerate(items):
-            if t == topic:
-                self.topic_list.selection_clear(0, tk.END)
-                self.topic_list.selection_set(i)
-                self.topic_list.activate(i)
-                self.topic_list.see(i)
-                return
+        i = self._topic_to_index.get(topic)
+        if i is None:
+            return
+        self.topic_list.selection_clear(0, tk.END)
+        self.topic_list.selection_set(i)
+        self.topic_list.activate(i)
+        self.topic_list.see(i)
 
     # ---------------- Easter egg launcher ---------------- #
 
@@ -545,44 +663,39 @@ class HelpTab(ttk.Frame):
 
     # ---------------- Rendering ---------------- #
 
+    def _render_all_topics(self):
+        """Insert every topic into the Text once and record its line range."""
+        args = []
+        line = 1
+        for topic in self._topics_master:
+            topic_args = _RENDERED.get(topic, _DIVIDER_ARGS)
+            n_lines = sum(chars.count("\n") for chars in topic_args[::2])
+            self._topic_lines[topic] = (line, line + n_lines)
+            line += n_lines
+            args.extend(topic_args)
+
+        text = self.text
+        text.configure(state="normal")
+        # One Tcl call for all topics: replace takes alternating chars/tagList
+        # pairs like insert and tags exactly the characters of each pair.
+        text.replace("1.0", tk.END, *args)
+        text.configure(state="disabled")
+
     def _render_topic(self, topic: str):
         self._current_topic = topic
         self.title_var.set(topic)
 
-        sections = self._get_sections()
-        blocks = sections.get(topic, [])
-
-        self.text.configure(state="normal")
-        self.text.delete("1.0", tk.END)
-        self.text.tag_remove("hit", "1.0", tk.END)
+        lines = self._topic_lines.get(topic)
+        if lines is None:
+            return
 
-        for kind, content in blocks:
-            if kind == "h1":
-                self._add_line(content, "h1")
-            elif kind == "h2":
-                self._add_line(content, "h2")
-            elif kind == "p":
-                self._add_line(content, "p")
-            elif kind == "muted":
-                self._add_line(content, "muted")
-            elif kind == "bullet":
-                self._add_line(f"• {content}", "bullet")
-            elif kind == "num":
-                self._add_line(content, "num")
-            elif kind == "code":
-                self._add_block(content, "code")
-            elif kind == "callout":
-                self._add_block(content, "callout")
-            else:
-                self._add_line(str(content), "p")
-
-            self.text.insert(tk.END, "\n")
-
-        self.text.insert(tk.END, "────────────────────────────────────────\n")
-        self.text.tag_add("divider", "end-2l", "end-1l")
-
-        self.text.configure(state="disabled")
-        self.text.yview_moveto(0.0)
+        # Nothing is inserted or deleted: -startline/-endline limit the widget
+        # to the topic's lines, and indices ("1.0", END, search) become
+        # relative to that range. Clear hits while the old range is shown.
+        text = self.text
+        text.tag_remove("hit", "1.0", tk.END)
+        text.configure(startline=lines[0], endline=lines[1])
+        text.yview_moveto(0.0)
 
     def _highlight_query_hits(self, query: str):
         """
@@ -592,82 +705,71 @@ class HelpTab(ttk.Frame):
         if not q:
             return
 
-        tokens = [t for t in q.split() if t]
-        if not tokens:
-            return
+        # One regex search pass for all tokens instead of one per token:
+        # repeats removed, longest first so the fullest match wins, and single
+        # characters skipped (they would light up most of the text).
+        tokens = sorted({t.lower() for t in q.split() if len(t) > 1}, key=len, reverse=True)
 
         self.text.configure(state="normal")
         self.text.tag_remove("hit", "1.0", tk.END)
 
-        for tok in tokens:
+        if tokens:
+            pattern = "|".join(re.escape(t) for t in tokens)
+            count = tk.IntVar(self)
             start = "1.0"
             while True:
-                idx = self.text.search(tok, start, stopindex=tk.END, nocase=True)
+                idx = self.text.search(
+                    pattern, start, stopindex=tk.END, regexp=True, nocase=True, count=count
+                )
                 if not idx:
                     break
-                end = f"{idx}+{len(tok)}c"
+                end = f"{idx}+{count.get()}c"
                 self.text.tag_add("hit", idx, end)
                 start = end
 
         self.text.configure(state="disabled")
 
-    def _add_line(self, text: str, tag: str):
-        start = self.text.index(tk.END)
-        self.text.insert(tk.END, text + "\n")
-        end = self.text.index(tk.END)
-        self.text.tag_add(tag, start, end)
-
-    def _add_block(self, text: str, tag: str):
-        start = self.text.index(tk.END)
-        self.text.insert(tk.END, text.strip() + "\n")
-        end = self.text.index(tk.END)
-        self.text.tag_add(tag, start, end)
-
     def _on_topic_selected(self, _event=None):
         sel = self.topic_list.curselection()
         if not sel:
             return
-        topic = self.topic_list.get(sel[0])
-        self._render_topic(topic)
+        topic = self._listed_topics[sel[0]]
+        if self._pending_render is None:
+            # <<ListboxSelect>> also fires on re-clicks of the shown topic
+            if topic == self._current_topic:
+                return
+            self._pending_render = self.after_idle(self._render_pending_topic)
+        self._pending_topic = topic
+
+    def _render_pending_topic(self):
+        self._pending_render = None
+        topic, self._pending_topic = self._pending_topic, None
+        if topic is not None and topic != self._current_topic:
+            self._render_topic(topic)
 
     # ---------------- Copy helpers ---------------- #
 
     def _copy_section(self):
-        sections = self._get_sections()
-        blocks = sections.get(self._current_topic, [])
-
-        plain = [self._current_topic, "-" * len(self._current_topic)]
-        for kind, content in blocks:
-            if kind in ("h1", "h2", "p", "muted", "code", "callout"):
-                plain.append(str(content).strip())
-            elif kind == "bullet":
-                plain.append(f"- {content}")
-            elif kind == "num":
-                plain.append(content)
-
-        txt = "\n".join(plain).strip()
+        topic = self._current_topic
+        txt = self._plain_cache.get(topic)
+        if txt is None:
+            txt = "\n".join(_plain_lines(topic, _SECTIONS.get(topic, ()))).strip()
+            self._plain_cache[topic] = txt
+
         self.clipboard_clear()
         self.clipboard_append(txt)
         messagebox.showinfo("Copied", "This help section was copied to clipboard.")
 
     def _copy_all(self):
-        sections = self._get_sections()
-        out = []
+        txt = self._all_plain
+        if txt is None:
+            out = []
+            extend = out.extend
+            for topic in self._topics_master:
+                extend(_plain_lines(topic, _SECTIONS.get(topic, ())))
+                out.append("")
+            txt = self._all_plain = "\n".join(out).strip()
 
-        for topic in self._topics_master:
-            blocks = sections.get(topic, [])
-            out.append(topic)
-            out.append("-" * len(topic))
-            for kind, content in blocks:
-                if kind in ("h1", "h2", "p", "muted", "code", "callout"):
-                    out.append(str(content).strip())
-                elif kind == "bullet":
-                    out.append(f"- {content}")
-                elif kind == "num":
-                    out.append(content)
-            out.append("")
-
-        txt = "\n".join(out).strip()
         self.clipboard_clear()
         self.clipboard_append(txt)
         messagebox.showinfo("Copied", "All help text was copied to clipboard.")
@@ -1,10 +1,27 @@
 import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-from core.case_finder import scan_folder, TARGET_PATTERNS
-from core.case_processor import process_case
-from core.comparison_builder import build_workbook
+from core.case_finder import list_subfolders, scan_folder, TARGET_PATTERNS
+
+# core.case_processor and core.comparison_builder pull in pandas. They are
+# imported where a run starts, on the worker thread, so the window comes up
+# without loading them.
+
+
+def _split_target_jobs(target_cases: dict):
+    """Return ([(label, pwb path)] to process, [labels not found]) in TARGET_PATTERNS order."""
+    jobs = []
+    missing = []
+    for label in TARGET_PATTERNS:
+        pwb_path = target_cases.get(label)
+        if pwb_path:
+            jobs.append((label, pwb_path))
+        else:
+            missing.append(label)
+    return jobs, missing
 
 
 class CaseProcessingTab(ttk.Frame):
@@ -15,6 +32,10 @@ class CaseProcessingTab(ttk.Frame):
       - Multi-folder mode: each subfolder is a scenario to compare
     """
 
+    # The log keeps only the newest lines so long batch sessions don't make
+    # every insert re-layout an ever-growing Text widget.
+    LOG_MAX_LINES = 5000
+
     def __init__(self, master):
         super().__init__(master)
 
@@ -27,6 +48,11 @@ class CaseProcessingTab(ttk.Frame):
         # For single-folder mode: label -> full path
         self.target_cases = {}
 
+        # Folder scans by path: (dir mtime_ns, cases, target_cases, log lines).
+        # Adding, removing or renaming a file bumps the directory mtime, so a
+        # stale entry is never reused.
+        self._scan_cache = {}
+
         # Filter options
         # NOTE: v2 meaning: "Expandable issue view" (not true dedup)
         self.max_filter_var = tk.BooleanVar(value=True)
@@ -37,20 +63,80 @@ class CaseProcessingTab(ttk.Frame):
         # NEW: delete filtered CSVs AFTER combined workbook is created
         self.delete_filtered_after_combined_var = tk.BooleanVar(value=False)
 
+        # Show the first rows of each filtered CSV in the preview table
+        self.show_preview_var = tk.BooleanVar(value=True)
+
         self._is_running = False
 
+        # Worker threads never touch Tk: they queue log lines (str) and
+        # completion callbacks (callables), drained here on the Tk thread.
+        self._ui_queue = queue.Queue()
+
         self._build_gui()
+        self.after(50, self._drain_ui_queue)
 
     # ───────────── Logging helper ───────────── #
 
     def log(self, msg: str):
+        if threading.current_thread() is not threading.main_thread():
+            self._ui_queue.put(msg)
+            return
+        self._write_log(msg)
+
+    def _write_log(self, msg: str):
         if self.local_log is not None:
             self.local_log.insert(tk.END, msg + "\n")
+            lines = int(self.local_log.index("end-1c").split(".")[0])
+            if lines > self.LOG_MAX_LINES:
+                self.local_log.delete("1.0", f"{lines - self.LOG_MAX_LINES}.0")
             self.local_log.see(tk.END)
 
         if self.external_log_func:
             self.external_log_func(msg)
 
+    def _drain_ui_queue(self):
+        lines = []
+        try:
+            while True:
+                item = self._ui_queue.get_nowait()
+                if callable(item):
+                    # Flush what the worker logged before running its callback
+                    if lines:
+                        self._write_log("\n".join(lines))
+                        lines = []
+                    item()
+                else:
+                    lines.append(item)
+        except queue.Empty:
+            pass
+
+        if lines:
+            self._write_log("\n".join(lines))
+
+        self.after(50, self._drain_ui_queue)
+
+    def _start_worker(self, target, *args):
+        """Run target(*args) on a daemon thread with COM initialised for SimAuto."""
+
+        def run():
+            # SimAuto is a COM server; this thread must initialise COM before
+            # export_violation_ctg can Dispatch it. pythoncom ships with
+            # pywin32, imported here so the GUI starts without it.
+            try:
+                import pythoncom
+            except ImportError:
+                pythoncom = None
+
+            if pythoncom is not None:
+                pythoncom.CoInitialize()
+            try:
+                target(*args)
+            finally:
+                if pythoncom is not None:
+                    pythoncom.CoUninitialize()
+
+        threading.Thread(target=run, daemon=True).start()
+
     # ───────────── GUI layout ───────────── #
 
     def _build_gui(self):
@@ -150,6 +236,25 @@ class CaseProcessingTab(ttk.Frame):
             variable=self.delete_filtered_after_combined_var,
         ).grid(row=4, column=0, sticky="w", padx=5, pady=(4, 2))
 
+        ttk.Checkbutton(
+            filters,
+            text="Show a preview of the filtered rows",
+            variable=self.show_preview_var,
+        ).grid(row=5, column=0, sticky="w", padx=5, pady=(4, 2))
+
+        # Filtered-data preview: a table draws only the visible cells, where a
+        # to_string() dump in the log re-wraps every column of every row.
+        preview_frame = ttk.LabelFrame(self, text="Filtered data preview")
+        preview_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=(4, 0))
+
+        self.preview_tree = ttk.Treeview(preview_frame, columns=(), show="headings", height=5)
+        preview_xscroll = ttk.Scrollbar(
+            preview_frame, orient="horizontal", command=self.preview_tree.xview
+        )
+        self.preview_tree.configure(xscrollcommand=preview_xscroll.set)
+        self.preview_tree.pack(side=tk.TOP, fill=tk.X, expand=True)
+        preview_xscroll.pack(side=tk.TOP, fill=tk.X)
+
         log_frame = ttk.LabelFrame(self, text="Case Processing Log")
         log_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
 
@@ -162,6 +267,22 @@ class CaseProcessingTab(ttk.Frame):
 
     # ───────────── Helpers ───────────── #
 
+    def _queue_preview(self, columns, rows):
+        """preview_func for process_case; safe to call from the worker thread."""
+        self._ui_queue.put(lambda: self._show_preview(columns, rows))
+
+    def _show_preview(self, columns, rows):
+        tree = self.preview_tree
+        tree.delete(*tree.get_children())
+        # Positional ids: export headers are not guaranteed to be unique.
+        col_ids = [f"c{i}" for i in range(len(columns))]
+        tree.configure(columns=col_ids)
+        for col_id, name in zip(col_ids, columns):
+            tree.heading(col_id, text=name)
+            tree.column(col_id, width=120, stretch=False, anchor="w")
+        for row in rows:
+            tree.insert("", "end", values=row)
+
     def _get_row_filter_categories(self):
         cats = set()
         if self.branch_mva_var.get():
@@ -190,31 +311,36 @@ class CaseProcessingTab(ttk.Frame):
             for _label, csv_path in (case_map or {}).items():
                 if not csv_path:
                     continue
-                if not os.path.isfile(csv_path):
-                    continue
 
                 base = os.path.basename(csv_path)
                 # conservative check: only delete filtered outputs
                 if not (base.endswith(".csv") and "_Filtered" in base):
                     continue
 
+                # No isfile() pre-check: a missing file is just skipped, which
+                # saves a stat per CSV on network-mounted case folders.
                 try:
                     os.remove(csv_path)
                     deleted.append(csv_path)
+                except FileNotFoundError:
+                    continue
                 except Exception as e:
                     errors.append((csv_path, str(e)))
 
+        # One log call per list: each call is a Text insert + scroll.
         if deleted:
-            self.log("\nDeleted filtered CSVs after combined workbook creation:")
-            for p in deleted:
-                self.log(f"  - {p}")
+            self.log(
+                "\nDeleted filtered CSVs after combined workbook creation:\n"
+                + "\n".join(f"  - {p}" for p in deleted)
+            )
         else:
             self.log("\nDelete filtered CSVs: none found to delete (from this run).")
 
         if errors:
-            self.log("\nErrors deleting some filtered CSVs:")
-            for p, err in errors:
-                self.log(f"  ERROR deleting {p}: {err}")
+            self.log(
+                "\nErrors deleting some filtered CSVs:\n"
+                + "\n".join(f"  ERROR deleting {p}: {err}" for p, err in errors)
+            )
 
     # ───────────── Single-case callbacks ───────────── #
 
@@ -242,23 +368,36 @@ class CaseProcessingTab(ttk.Frame):
         if not cats:
             self.log("WARNING: No LimViolCat categories selected. Row filter will be skipped.")
 
+        # Read Tk variables here; the worker thread must not touch them.
+        options = dict(
+            dedup_enabled=self.max_filter_var.get(),
+            keep_categories=cats,
+            delete_original=self.delete_original_var.get(),
+            show_preview=self.show_preview_var.get(),
+            preview_func=self._queue_preview,
+        )
+
         self._set_running(True)
+        self._start_worker(self._process_single_worker, pwb, options)
+
+    def _process_single_worker(self, pwb, options):
+        # Runs off the Tk thread: export + CSV post-processing can take minutes.
         try:
-            self.update_idletasks()
-            self.update()
-
-            filtered_csv = process_case(
-                pwb,
-                dedup_enabled=self.max_filter_var.get(),
-                keep_categories=cats,
-                delete_original=self.delete_original_var.get(),
-                log_func=self.log,
-            )
+            from core.case_processor import process_case
+
+            filtered_csv = process_case(pwb, log_func=self.log, **options)
         except Exception as e:
-            self.log(f"ERROR: {e}")
-            messagebox.showerror("Error", str(e))
+            error = str(e)
+            self.log(f"ERROR: {error}")
+            self._ui_queue.put(lambda: self._finish_single(None, error))
         else:
-            if filtered_csv:
+            self._ui_queue.put(lambda: self._finish_single(filtered_csv, None))
+
+    def _finish_single(self, filtered_csv, error):
+        try:
+            if error is not None:
+                messagebox.showerror("Error", error)
+            elif filtered_csv:
                 messagebox.showinfo("Done", f"Processing complete.\nFiltered CSV:\n{filtered_csv}")
             else:
                 messagebox.showwarning("Done", "Processing finished, but no filtered CSV was created.")
@@ -279,24 +418,37 @@ class CaseProcessingTab(ttk.Frame):
         self.case_tree.delete(*self.case_tree.get_children())
         self.target_cases = {}
 
-        cases, target_cases = scan_folder(folder, self.log)
-        self.target_cases = target_cases
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached = self._scan_cache.get(folder)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            _mtime, cases, target_cases, scan_lines = cached
+        else:
+            # Collect the scan messages and write them in one log call; the Text
+            # widget (and any external log) then updates once per scan, not per line.
+            scan_lines = []
+            cases, target_cases = scan_folder(folder, scan_lines.append)
+            if mtime is not None:
+                self._scan_cache[folder] = (mtime, cases, target_cases, scan_lines)
+
+        self.target_cases = dict(target_cases)
+        self.log("\n".join(scan_lines))
 
         if cases:
+            insert = self.case_tree.insert
             for info in cases:
-                tag = "target" if info["is_target"] else ""
-                self.case_tree.insert(
+                insert(
                     "",
                     "end",
                     values=(info["filename"], info["type"]),
-                    tags=(tag,) if tag else (),
+                    tags=("target",) if info["is_target"] else (),
                 )
             return
 
-        subdirs = sorted(
-            d for d in os.listdir(folder)
-            if os.path.isdir(os.path.join(folder, d))
-        )
+        subdirs = list_subfolders(folder)
 
         if not subdirs:
             self.log("No .pwb files or subfolders found in this folder.")
@@ -321,27 +473,55 @@ class CaseProcessingTab(ttk.Frame):
         if not cats:
             self.log("WARNING: No LimViolCat categories selected. Row filter will be skipped.")
 
-        subdirs = sorted(
-            d for d in os.listdir(root)
-            if os.path.isdir(os.path.join(root, d))
+        subdirs = list_subfolders(root)
+
+        # Read Tk variables here; the worker thread must not touch them.
+        options = dict(
+            dedup_enabled=self.max_filter_var.get(),
+            keep_categories=cats,
+            delete_original=self.delete_original_var.get(),
+            show_preview=self.show_preview_var.get(),
+            preview_func=self._queue_preview,
         )
+        delete_filtered = self.delete_filtered_after_combined_var.get()
 
         self._set_running(True)
+        if subdirs:
+            self._start_worker(
+                self._folder_worker, self._run_export_multi_folder, root, subdirs, options, delete_filtered
+            )
+        else:
+            self._start_worker(self._folder_worker, self._run_export_single_folder, root, options)
+
+    def _folder_worker(self, runner, *args):
+        # Runs off the Tk thread; dialogs and the button state go through _ui_queue.
         try:
-            if subdirs:
-                self._run_export_multi_folder(root, subdirs, cats)
-            else:
-                _, target_cases = scan_folder(root, self.log)
-                self.target_cases = target_cases
-                self._run_export_single_folder(root, cats)
+            runner(*args)
+        except Exception as e:
+            error = str(e)
+            self.log(f"ERROR: {error}")
+            self._show_dialog(messagebox.showerror, "Error", error)
         finally:
-            self._set_running(False)
+            # The run wrote CSVs/workbooks into the scanned folders; forget
+            # their cached scans rather than trust mtime resolution.
+            self._ui_queue.put(self._scan_cache.clear)
+            self._ui_queue.put(lambda: self._set_running(False))
+
+    def _show_dialog(self, dialog, title, message):
+        """Queue a messagebox call for the Tk thread (safe from worker threads)."""
+        self._ui_queue.put(lambda: dialog(title, message))
 
     # ---------- Single-folder mode ---------- #
 
-    def _run_export_single_folder(self, folder: str, cats):
+    def _run_export_single_folder(self, folder: str, options):
+        from core.case_processor import process_case
+
+        _, target_cases = scan_folder(folder, self.log)
+        self.target_cases = target_cases
+
         if not self.target_cases:
-            messagebox.showwarning(
+            self._show_dialog(
+                messagebox.showwarning,
                 "No target cases found",
                 "No recognized ACCA / DCwAC / AUXapplied cases detected.",
             )
@@ -349,26 +529,16 @@ class CaseProcessingTab(ttk.Frame):
 
         self.log("\n=== Batch processing ACCA/DC cases in folder ===")
 
-        errors = []
-        for label in TARGET_PATTERNS:
-            self.update_idletasks()
-            self.update()
-
-            pwb_path = self.target_cases.get(label)
-            if not pwb_path:
-                self.log(f"Skipping type [{label}] (not found).")
-                continue
+        jobs, missing = _split_target_jobs(self.target_cases)
+        if missing:
+            self.log("\n".join(f"Skipping type [{label}] (not found)." for label in missing))
 
+        errors = []
+        for label, pwb_path in jobs:
             self.log(f"\n--- Processing [{label}] case ---")
             self.log(f"Case path: {pwb_path}")
             try:
-                filtered_csv = process_case(
-                    pwb_path,
-                    dedup_enabled=self.max_filter_var.get(),
-                    keep_categories=cats,
-                    delete_original=self.delete_original_var.get(),
-                    log_func=self.log,
-                )
+                filtered_csv = process_case(pwb_path, log_func=self.log, **options)
                 if not filtered_csv:
                     raise RuntimeError("No filtered CSV was created.")
             except Exception as e:
@@ -377,19 +547,24 @@ class CaseProcessingTab(ttk.Frame):
                 errors.append(msg)
 
         if errors:
-            messagebox.showerror(
+            self._show_dialog(
+                messagebox.showerror,
                 "Batch processing completed with errors",
                 "Some cases failed. Check the log window for details.",
             )
         else:
-            messagebox.showinfo(
+            self._show_dialog(
+                messagebox.showinfo,
                 "Batch processing complete",
                 "All detected ACCA/DC cases in the folder have been processed.",
             )
 
     # ---------- Multi-folder mode ---------- #
 
-    def _run_export_multi_folder(self, root: str, subdirs, cats):
+    def _run_export_multi_folder(self, root: str, subdirs, options, delete_filtered: bool):
+        from core.case_processor import process_case
+        from core.comparison_builder import build_workbook
+
         self.log("\n=== Multi-folder mode: each subfolder is a case set to compare ===")
         self.log(f"Root folder: {root}")
         self.log(f"Subfolders found: {', '.join(subdirs)}")
@@ -398,9 +573,6 @@ class CaseProcessingTab(ttk.Frame):
         errors = []
 
         for sub in subdirs:
-            self.update_idletasks()
-            self.update()
-
             scenario_folder = os.path.join(root, sub)
             self.log(f"\n=== Processing scenario folder: {sub} ===")
 
@@ -411,25 +583,17 @@ class CaseProcessingTab(ttk.Frame):
 
             case_csvs = {}
 
-            for label in TARGET_PATTERNS:
-                self.update_idletasks()
-                self.update()
-
-                pwb_path = target_cases.get(label)
-                if not pwb_path:
-                    self.log(f"  [{sub}] Skipping type [{label}] (not found).")
-                    continue
+            jobs, missing = _split_target_jobs(target_cases)
+            if missing:
+                self.log(
+                    "\n".join(f"  [{sub}] Skipping type [{label}] (not found)." for label in missing)
+                )
 
+            for label, pwb_path in jobs:
                 self.log(f"\n  [{sub}] --- Processing [{label}] case ---")
                 self.log(f"  Case path: {pwb_path}")
                 try:
-                    filtered_csv = process_case(
-                        pwb_path,
-                        dedup_enabled=self.max_filter_var.get(),
-                        keep_categories=cats,
-                        delete_original=self.delete_original_var.get(),
-                        log_func=self.log,
-                    )
+                    filtered_csv = process_case(pwb_path, log_func=self.log, **options)
                     if not filtered_csv:
                         raise RuntimeError("No filtered CSV was created.")
                     case_csvs[label] = filtered_csv
@@ -447,7 +611,7 @@ class CaseProcessingTab(ttk.Frame):
         workbook_path = build_workbook(
             root,
             folder_to_case_csvs,
-            group_details=self.max_filter_var.get(),
+            group_details=options["dedup_enabled"],
             log_func=self.log,
         )
 
@@ -455,18 +619,27 @@ class CaseProcessingTab(ttk.Frame):
             self.log(f"\nCombined workbook created at:\n  {workbook_path}")
 
             # NEW: delete filtered csvs ONLY after workbook is successfully created
-            if self.delete_filtered_after_combined_var.get():
+            if delete_filtered:
                 self._delete_filtered_csvs_from_run(folder_to_case_csvs)
 
             if errors:
-                messagebox.showerror(
+                self._show_dialog(
+                    messagebox.showerror,
                     "Multi-folder processing completed with errors",
                     f"Workbook created:\n{workbook_path}\n\nSome cases failed; see log for details.",
                 )
             else:
-                messagebox.showinfo("Multi-folder processing complete", f"Workbook created:\n{workbook_path}")
+                self._show_dialog(
+                    messagebox.showinfo, "Multi-folder processing complete", f"Workbook created:\n{workbook_path}"
+                )
         else:
             if errors:
-                messagebox.showerror("Processing completed with errors", "No combined workbook created. See log for details.")
+                self._show_dialog(
+                    messagebox.showerror,
+                    "Processing completed with errors",
+                    "No combined workbook created. See log for details.",
+                )
             else:
-                messagebox.showwarning("Nothing processed", "No valid subfolders / cases found to build a workbook.")
+                self._show_dialog(
+                    messagebox.showwarning, "Nothing processed", "No valid subfolders / cases found to build a workbook."
+                )
@@ -8,13 +8,11 @@ from typing import Optional, List, Tuple
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-from core.comparator import (
-    list_sheets,
-    build_all_case_type_comparisons,
-    build_batch_comparison_workbook,
-)
 from core.case_types import CASE_TYPE_DEFINITIONS
 
+# core.comparator (pandas + openpyxl) is imported on first use, so the window
+# comes up without loading it.
+
 
 class CompareTab(ttk.Frame):
     """
@@ -386,6 +384,8 @@ class CompareTab(ttk.Frame):
             ok = False
             err_msg = None
             try:
+                from core.comparator import build_batch_comparison_workbook
+
                 build_batch_comparison_workbook(
                     src_workbook=wb,
                     pairs=pairs_snapshot,                 # may be []
@@ -429,6 +429,8 @@ class CompareTab(ttk.Frame):
         self.log(f"Loaded workbook: {path}")
 
         try:
+            from core.comparator import list_sheets
+
             self._sheets = list_sheets(path)
         except Exception as e:
             self.log(f"ERROR reading sheet names: {e}")
@@ -483,6 +485,8 @@ class CompareTab(ttk.Frame):
         self._set_running(True)
         try:
             try:
+                from core.comparator import build_all_case_type_comparisons
+
                 comparisons = build_all_case_type_comparisons(
                     wb,
                     base_sheet=left_sheet,
@@ -2,6 +2,7 @@
 # gui/trends_view.py
 
 import os
+import re
 import threading
 import queue
 import tkinter as tk
@@ -15,6 +16,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from matplotlib import rcParams
 from itertools import cycle
+from functools import lru_cache
 
 
 CASE_TYPES = [
@@ -26,27 +28,92 @@ CASE_TYPES = [
 
 
 def _safe_float(x):
+    # Fast paths: most percent cells arrive as plain floats/ints or text.
+    if x is None:
+        return None
+    t = type(x)
+    if t is float:
+        return x
+    if t is int:
+        return float(x)
+    if t is str:
+        return _text_to_float(x)
     try:
-        if x is None:
-            return None
         if isinstance(x, (int, float)):
             return float(x)
-        s = str(x).strip().replace("%", "")
-        if not s:
-            return None
-        return float(s)
+        return _text_to_float(str(x))
     except Exception:
         return None
 
 
+@lru_cache(maxsize=4096)
+def _text_to_float(s):
+    # Text percents ("95.3%", "100%") repeat a lot, so cache the parse.
+    s = s.strip().replace("%", "")
+    if not s:
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
 def _norm(s):
     if s is None:
         return ""
+    if type(s) is str:
+        return s.strip()
     return str(s).strip()
 
 
-def _contains(a, b):
-    return b.lower() in a.lower()
+@lru_cache(maxsize=4096)
+def _issue_key(issue):
+    # Keep it mostly as-is, but trim whitespace. The same issue names repeat
+    # on every sheet, so nearly every lookup is a cache hit.
+    return issue.strip()
+
+
+# A table header row mentions "Resulting Issue" plus "Percent" or "Loading".
+# One anchored, case-insensitive match per row, so non-header rows (nearly
+# all of them) are never lowercased.
+_HEADER_ROW_RE = re.compile(
+    r"(?=.*resulting issue)(?=.*(?:percent|loading))",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+# Case-type labels searched above each table header, in priority order.
+# Important: "acca" appears in "ACCA LongTerm", so check longterm first.
+_CASE_TYPE_NEEDLES = (
+    ("acca longterm", "acca_longterm"),
+    ("acca long term", "acca_longterm"),
+    ("dcwac", "dcwac"),
+    ("auxapplied", "auxapplied"),
+    ("acca", "acca"),
+)
+# Every needle contains one of these, so rows without a hit are skipped
+# before any lowercasing.
+_CASE_TYPE_HINT_RE = re.compile(r"acca|dcwac|auxapplied", re.IGNORECASE)
+
+
+class _SheetValueReader:
+    """
+    Value-only access to a workbook's sheets through openpyxl read-only.
+    rows() returns the sheet from A1, at most `max_col` columns wide.
+    """
+
+    def __init__(self, path):
+        self._wb = load_workbook(path, data_only=True, read_only=True)
+        self.sheet_names = self._wb.sheetnames
+
+    def rows(self, sheet_name, max_col=30):
+        # In read-only mode ws.cell() has to re-parse the sheet XML up to the
+        # requested row, so random access is quadratic; iter_rows streams
+        # each row exactly once.
+        return list(self._wb[sheet_name].iter_rows(max_col=max_col, values_only=True))
+
+    def close(self):
+        self._wb.close()
 
 
 class TrendsView(ttk.Frame):
@@ -60,6 +127,10 @@ class TrendsView(ttk.Frame):
         - Plot trends across cases
     """
 
+    # The log keeps only the newest lines so repeated scans don't make every
+    # insert re-layout an ever-growing Text widget.
+    LOG_MAX_LINES = 5000
+
     def __init__(self, master):
         super().__init__(master)
 
@@ -69,8 +140,10 @@ class TrendsView(ttk.Frame):
 
         # Data structure:
         # self._trend_data[case_type]["issues"][issue_key] = list of (sheet_name, loading)
+        # self._trend_data[case_type]["stats"][issue_key] = [max loading, set of sheet names]
+        #   (kept up to date by _merge_parsed so list refreshes don't rescan points)
         self._trend_data = {
-            ct_key: {"issues": {}, "cases": []} for _, ct_key in CASE_TYPES
+            ct_key: {"issues": {}, "cases": [], "stats": {}} for _, ct_key in CASE_TYPES
         }
 
         self._ui_queue = queue.Queue()
@@ -79,6 +152,15 @@ class TrendsView(ttk.Frame):
 
         self._colors = {}
 
+        # Log lines waiting for the next idle flush (see _log / _flush_log).
+        self._log_buf = []
+        self._log_pending = False
+
+        # Parsed sheets of the current workbook file (see _cached_sheets).
+        # Only the worker threads touch these.
+        self._parse_cache_key = None
+        self._parse_cache = {}
+
         self._build_ui()
         self._build_plot()
 
@@ -190,9 +272,24 @@ class TrendsView(ttk.Frame):
     # ---------------- Logging ---------------- #
 
     def _log(self, msg):
-        self.log.insert(tk.END, msg + "\n")
+        # Buffer and flush once when Tk goes idle: a burst of messages becomes
+        # a single insert/see instead of a forced redraw per line.
+        self._log_buf.append(msg + "\n")
+        if not self._log_pending:
+            self._log_pending = True
+            self.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        self._log_pending = False
+        if not self._log_buf:
+            return
+        text = "".join(self._log_buf)
+        self._log_buf.clear()
+        self.log.insert(tk.END, text)
+        lines = int(self.log.index("end-1c").split(".")[0])
+        if lines > self.LOG_MAX_LINES:
+            self.log.delete("1.0", f"{lines - self.LOG_MAX_LINES}.0")
         self.log.see(tk.END)
-        self.update_idletasks()
 
     # ---------------- Actions ---------------- #
 
@@ -210,9 +307,9 @@ class TrendsView(ttk.Frame):
 
         # Load sheet names (quick)
         try:
-            wb = load_workbook(path, data_only=True, read_only=True)
-            self._sheet_names = wb.sheetnames
-            wb.close()
+            reader = _SheetValueReader(path)
+            self._sheet_names = reader.sheet_names
+            reader.close()
         except Exception as e:
             messagebox.showerror("Error", f"Could not read workbook.\n\n{e}")
             self._sheet_names = []
@@ -282,23 +379,50 @@ class TrendsView(ttk.Frame):
 
     # ---------------- Worker Threads ---------------- #
 
+    def _cached_sheets(self, path):
+        """
+        Parsed-sheet cache (sheet name -> _parse_sheet result) for `path`.
+        The cache is dropped when the path or its modification time changes,
+        so a re-saved workbook is parsed again.
+        """
+        try:
+            key = (path, os.path.getmtime(path))
+        except OSError:
+            key = None
+
+        if key is None or key != self._parse_cache_key:
+            self._parse_cache_key = key
+            self._parse_cache = {}
+        return self._parse_cache
+
     def _worker_scan_all(self):
         try:
             path = self._workbook_path
-            wb = load_workbook(path, data_only=True, read_only=True)
+            cache = self._cached_sheets(path)
+
+            # Only open the workbook if some sheet still has to be parsed.
+            reader = None
+            sheet_names = list(self._sheet_names)
+            if not sheet_names or any(s not in cache for s in sheet_names):
+                reader = _SheetValueReader(path)
+                sheet_names = reader.sheet_names
+            total = len(sheet_names)
 
-            for i, sheet_name in enumerate(wb.sheetnames):
+            for i, sheet_name in enumerate(sheet_names):
                 if self._stop_flag.is_set():
                     break
 
-                ws = wb[sheet_name]
-                self._ui_queue.put(("log", f"Scanning sheet {i+1}/{len(wb.sheetnames)}: {sheet_name}"))
-                parsed = self._parse_sheet(ws, sheet_name)
+                self._ui_queue.put(("log", f"Scanning sheet {i+1}/{total}: {sheet_name}"))
+                parsed = cache.get(sheet_name)
+                if parsed is None:
+                    parsed = self._parse_sheet(reader.rows(sheet_name), sheet_name)
+                    cache[sheet_name] = parsed
 
                 # push parsed partial to UI thread
                 self._ui_queue.put(("merge", parsed))
 
-            wb.close()
+            if reader is not None:
+                reader.close()
             self._ui_queue.put(("done", None))
         except Exception as e:
             self._ui_queue.put(("error", str(e)))
@@ -306,16 +430,22 @@ class TrendsView(ttk.Frame):
     def _worker_scan_one(self, sheet_name):
         try:
             path = self._workbook_path
-            wb = load_workbook(path, data_only=True, read_only=True)
-            if sheet_name not in wb.sheetnames:
-                wb.close()
-                self._ui_queue.put(("error", f"Sheet not found: {sheet_name}"))
-                return
-
-            ws = wb[sheet_name]
-            self._ui_queue.put(("log", f"Scanning single sheet: {sheet_name}"))
-            parsed = self._parse_sheet(ws, sheet_name)
-            wb.close()
+            cache = self._cached_sheets(path)
+
+            parsed = cache.get(sheet_name)
+            if parsed is None:
+                reader = _SheetValueReader(path)
+                if sheet_name not in reader.sheet_names:
+                    reader.close()
+                    self._ui_queue.put(("error", f"Sheet not found: {sheet_name}"))
+                    return
+
+                self._ui_queue.put(("log", f"Scanning single sheet: {sheet_name}"))
+                parsed = self._parse_sheet(reader.rows(sheet_name), sheet_name)
+                reader.close()
+                cache[sheet_name] = parsed
+            else:
+                self._ui_queue.put(("log", f"Scanning single sheet: {sheet_name} (cached)"))
 
             self._ui_queue.put(("merge", parsed))
             self._ui_queue.put(("done", None))
@@ -325,15 +455,23 @@ class TrendsView(ttk.Frame):
     # ---------------- UI Thread Merge ---------------- #
 
     def _poll_ui_queue(self):
+        # Log lines are collected and written to the Text widget in one go,
+        # rather than one insert + redraw per queued message.
+        pending_log = []
         try:
             while True:
                 item = self._ui_queue.get_nowait()
                 kind, payload = item
 
                 if kind == "log":
-                    self._log(payload)
+                    pending_log.append(payload)
+                    continue
+
+                if pending_log:
+                    self._log("\n".join(pending_log))
+                    pending_log = []
 
-                elif kind == "merge":
+                if kind == "merge":
                     self._merge_parsed(payload)
 
                 elif kind == "done":
@@ -350,12 +488,18 @@ class TrendsView(ttk.Frame):
         except queue.Empty:
             pass
 
+        if pending_log:
+            self._log("\n".join(pending_log))
+
         self.after(100, self._poll_ui_queue)
 
     # ---------------- Parsing Logic ---------------- #
 
-    def _parse_sheet(self, ws, sheet_name):
+    def _parse_sheet(self, values, sheet_name):
         """
+        `values` is the sheet as a list of row value tuples/lists, from A1
+        (see _SheetValueReader.rows).
+
         Returns dict:
         {
           'acca':   {'case': sheet_name, 'rows': [(issue, pct), ...]},
@@ -372,28 +516,25 @@ class TrendsView(ttk.Frame):
         # The combined violation sheets you showed usually have a big merged header cell
         # with "ACCA" or "DCwAC" above the table.
 
-        max_row = ws.max_row
-        max_col = min(ws.max_column, 30)
+        max_row = len(values)
 
         # Read a small grid of text for detection
-        grid = []
-        for r in range(1, max_row + 1):
-            row = []
-            for c in range(1, max_col + 1):
-                v = ws.cell(r, c).value
-                row.append(_norm(v))
-            grid.append(row)
+        grid = [[_norm(v) for v in row] for row in values]
+
+        # Join each row once; header detection and case-type inference both
+        # search this text.
+        row_text = [" | ".join(row) for row in grid]
 
         # Find table header rows by looking for "Resulting Issue" and "Percent"
-        header_rows = []
-        for r_idx, row in enumerate(grid, start=1):
-            joined = " | ".join(row)
-            if _contains(joined, "Resulting Issue") and (_contains(joined, "Percent") or _contains(joined, "Loading")):
-                header_rows.append(r_idx)
+        header_rows = [
+            r_idx
+            for r_idx, t in enumerate(row_text, start=1)
+            if _HEADER_ROW_RE.match(t)
+        ]
 
         # For each detected header row, infer case type from nearby rows above
-        for hr in header_rows:
-            case_type = self._infer_case_type(grid, hr)
+        for i, hr in enumerate(header_rows):
+            case_type = self._infer_case_type(row_text, hr)
             if not case_type:
                 continue
 
@@ -403,70 +544,66 @@ class TrendsView(ttk.Frame):
             if issue_col is None or pct_col is None:
                 continue
 
-            # Read rows below header until blank-ish
+            # Read rows below header until blank-ish: a couple of blank rows
+            # are allowed, but 4 in a row (or the end of the sheet) ends the
+            # table. One forward pass with a running blank count, so no row
+            # is parsed more than once. The next table's header row always
+            # ends this one, even when blocks are only one blank row apart.
+            end_row = header_rows[i + 1] - 1 if i + 1 < len(header_rows) else max_row
             rows = []
-            r = hr + 1
-            while r <= max_row:
-                issue = _norm(ws.cell(r, issue_col + 1).value)
-                pct = _safe_float(ws.cell(r, pct_col + 1).value)
-
-                # Stop if table ended
-                if not issue and pct is None:
-                    # allow a couple blanks but stop on strong blank
-                    # if next few also blank, break
-                    blank_run = True
-                    for rr in range(r, min(r + 3, max_row) + 1):
-                        ii = _norm(ws.cell(rr, issue_col + 1).value)
-                        pp = _safe_float(ws.cell(rr, pct_col + 1).value)
-                        if ii or (pp is not None):
-                            blank_run = False
-                            break
-                    if blank_run:
-                        break
+            blank_run = 0
+            for r in range(hr, end_row):
+                issue = grid[r][issue_col]
+                pct = _safe_float(values[r][pct_col])
 
                 if issue and pct is not None:
                     rows.append((issue, pct))
-
-                r += 1
+                    blank_run = 0
+                elif issue or pct is not None:
+                    blank_run = 0
+                else:
+                    blank_run += 1
+                    if blank_run == 4:
+                        break
 
             # Append into that case type bucket
             result[case_type]["rows"].extend(rows)
 
         return result
 
-    def _infer_case_type(self, grid, header_row):
+    def _infer_case_type(self, row_text, header_row):
         # Search upward for a row containing one of the case type names
         search_up = 6
         for rr in range(max(1, header_row - search_up), header_row):
-            joined = " | ".join(grid[rr - 1])
-            j = joined.lower()
-            if "acca longterm" in j or "acca long term" in j:
-                return "acca_longterm"
-            if "dcwac" in j:
-                return "dcwac"
-            if "auxapplied" in j:
-                return "auxapplied"
-            # important: "ACCA" appears in "ACCA LongTerm", so check longterm first
-            if "acca" in j:
-                return "acca"
+            t = row_text[rr - 1]
+            if not _CASE_TYPE_HINT_RE.search(t):
+                continue
+            j = t.lower()
+            for needle, case_type in _CASE_TYPE_NEEDLES:
+                if needle in j:
+                    return case_type
         return None
 
     def _find_issue_and_pct_cols(self, header_cells):
+        # One pass over the header row. The looser match (first cell that just
+        # says "percent") is remembered along the way and only used if no
+        # "percent ... load" header exists.
         issue_col = None
         pct_col = None
+        loose_pct_col = None
         for idx, txt in enumerate(header_cells):
+            if not txt:
+                continue
             t = txt.lower()
             if "resulting issue" in t:
                 issue_col = idx
-            if ("percent" in t and "load" in t) or (t.strip() == "percent loading") or ("loading" in t and "percent" in t):
-                pct_col = idx
-        # If exact name not found, try looser matches
-        if pct_col is None:
-            for idx, txt in enumerate(header_cells):
-                t = txt.lower()
-                if "percent" in t:
+            if "percent" in t:
+                if "load" in t:
                     pct_col = idx
-                    break
+                elif loose_pct_col is None:
+                    loose_pct_col = idx
+        if pct_col is None:
+            pct_col = loose_pct_col
         return issue_col, pct_col
 
     # ---------------- Data Merge ---------------- #
@@ -475,6 +612,7 @@ class TrendsView(ttk.Frame):
         for _, k in CASE_TYPES:
             self._trend_data[k]["issues"].clear()
             self._trend_data[k]["cases"].clear()
+            self._trend_data[k]["stats"].clear()
         self._colors = {}
         self._clear_issue_lists()
         self._clear_plot()
@@ -488,18 +626,30 @@ class TrendsView(ttk.Frame):
             if case_name not in self._trend_data[k]["cases"]:
                 self._trend_data[k]["cases"].append(case_name)
 
+            issues = self._trend_data[k]["issues"]
+            stats = self._trend_data[k]["stats"]
             for issue, pct in rows:
                 issue_key = self._normalize_issue_key(issue)
-                issues = self._trend_data[k]["issues"]
-                issues.setdefault(issue_key, [])
-                issues[issue_key].append((case_name, pct))
+
+                # One lookup per row; new issues get their point list and
+                # stats entry together (the two maps always share keys).
+                pts = issues.get(issue_key)
+                if pts is None:
+                    pts = issues[issue_key] = []
+                    st = stats[issue_key] = [None, set()]
+                else:
+                    st = stats[issue_key]
+
+                pts.append((case_name, pct))
+                st[1].add(case_name)
+                if pct is not None and (st[0] is None or pct > st[0]):
+                    st[0] = pct
 
         # update colors after merge
         self._assign_colors()
 
     def _normalize_issue_key(self, issue):
-        # Keep it mostly as-is, but trim whitespace
-        return issue.strip()
+        return _issue_key(issue)
 
     # ---------------- Colors (FIXED) ---------------- #
 
@@ -539,18 +689,14 @@ class TrendsView(ttk.Frame):
 
         for _, ct_key in CASE_TYPES:
             tree = self._issue_trees[ct_key]
-            issues = self._trend_data[ct_key]["issues"]
+            stats = self._trend_data[ct_key]["stats"]
 
-            # compute max pct and count per issue
+            # max pct and count per issue (maintained by _merge_parsed)
             rows = []
-            for issue_key, pts in issues.items():
-                vals = [p for _, p in pts if p is not None]
-                if not vals:
+            for issue_key, (mx, cases) in stats.items():
+                if mx is None or mx < min_pct:
                     continue
-                mx = max(vals)
-                if mx < min_pct:
-                    continue
-                rows.append((issue_key, mx, len(set([c for c, _ in pts]))))
+                rows.append((issue_key, mx, len(cases)))
 
             # sort highest to lowest by max
             rows.sort(key=lambda x: x[1], reverse=True)
@@ -597,12 +743,8 @@ class TrendsView(ttk.Frame):
 
         # rank by max pct
         ranked = []
-        for issue_key, pts in issues.items():
-            vals = [p for _, p in pts if p is not None]
-            if not vals:
-                continue
-            mx = max(vals)
-            if mx < min_pct:
+        for issue_key, (mx, _) in self._trend_data[ct]["stats"].items():
+            if mx is None or mx < min_pct:
                 continue
             ranked.append((issue_key, mx))
 
@@ -686,9 +828,9 @@ class TrendsView(ttk.Frame):
         self._log(f"Workbook path set externally: {path}")
 
         try:
-            wb = load_workbook(path, data_only=True, read_only=True)
-            self._sheet_names = wb.sheetnames
-            wb.close()
+            reader = _SheetValueReader(path)
+            self._sheet_names = reader.sheet_names
+            reader.close()
         except Exception as e:
             self._log(f"ERROR reading workbook: {e}")
             self._sheet_names = []
@@ -0,0 +1,170 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core import case_processor
+from core.case_processor import post_process_csv
+
+
+HEADERS = ["CTGLabel", "LimViolCat", "LimViolID", "LimViolPct", "BusNum", "Extra"]
+
+DATA_ROWS = [
+    ["CTG 1", "Branch MVA", "Line 1", "95.5", "1", "a"],
+    ["CTG 2", "Bus Low Volts", "Bus 7", "80", "2", "b"],
+    ["CTG 3", "Branch MVA", "Line 2", "101.25", "3", ""],
+    ["CTG 4", "Branch MVA", "Line 1", "99", "4", "d"],
+    ["CTG 5", "Interface MW", "IF 1", "120", "5", "e"],
+    ["CTG 6", "Branch MVA", "Line 3", "88", "6", "f"],
+    ["CTG 7", "Bus Low Volts", "Bus 9", "91", "7", "g"],
+]
+
+
+def _csv_line(values):
+    return ",".join(values) + "\n"
+
+
+class PostProcessCsvTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.temp_dir.name, "case_ViolationCTG.csv")
+        self.logs = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_export(self, headers=None, rows=(), title=True):
+        with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
+            if title:
+                f.write("ViolationCTG\n")
+            if headers is not None:
+                f.write(_csv_line(headers))
+            for row in rows:
+                f.write(_csv_line(row))
+
+    def _run(self, keep_categories=("Branch MVA",), dedup_enabled=False):
+        return post_process_csv(
+            self.csv_path,
+            dedup_enabled,
+            set(keep_categories),
+            self.logs.append,
+            show_preview=False,
+        )
+
+    def _removed_rows(self):
+        prefix = "Rows removed by row filter: "
+        counts = [int(m[len(prefix):]) for m in self.logs if m.startswith(prefix)]
+        self.assertEqual(len(counts), 1)
+        return counts[0]
+
+    def _read(self, path):
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_row_filter_uses_blacklisted_limviolcat(self):
+        self._write_export(HEADERS, DATA_ROWS)
+
+        out = self._run()
+
+        self.assertEqual(out, os.path.join(self.temp_dir.name, "case_ViolationCTG_Filtered.csv"))
+        self.assertEqual(
+            self._read(out),
+            "CTGLabel,LimViolID,LimViolPct,Extra\n"
+            "CTG 1,Line 1,95.5,a\n"
+            "CTG 3,Line 2,101.25,\n"
+            "CTG 4,Line 1,99,d\n"
+            "CTG 6,Line 3,88,f\n",
+        )
+        self.assertEqual(self._removed_rows(), 3)
+
+    def test_chunked_read_matches_single_chunk(self):
+        self._write_export(HEADERS, DATA_ROWS)
+        single = self._read(self._run(dedup_enabled=True))
+        self.logs.clear()
+
+        with mock.patch.object(case_processor, "CSV_CHUNK_ROWS", 2):
+            chunked = self._read(self._run(dedup_enabled=True))
+
+        self.assertEqual(chunked, single)
+        self.assertEqual(
+            chunked,
+            "CTGLabel,LimViolID,LimViolPct,Extra\n"
+            "CTG 4,Line 1,99,d\n"
+            "CTG 1,Line 1,95.5,a\n"
+            "CTG 3,Line 2,101.25,\n"
+            "CTG 6,Line 3,88,f\n",
+        )
+        self.assertEqual(self._removed_rows(), 3)
+
+    def test_duplicate_headers_are_kept_once_each(self):
+        headers = ["CTGLabel", "LimViolCat", "LimViolID", "LimViolPct", "Extra", "Extra"]
+        rows = [
+            ["CTG 1", "Branch MVA", "Line 1", "95", "a", "b"],
+            ["CTG 2", "Bus Low Volts", "Bus 7", "80", "c", "d"],
+        ]
+        self._write_export(headers, rows)
+
+        out = self._run()
+
+        self.assertEqual(
+            self._read(out),
+            "CTGLabel,LimViolID,LimViolPct,Extra,Extra\n"
+            "CTG 1,Line 1,95,a,b\n",
+        )
+        self.assertEqual(self._removed_rows(), 1)
+
+    def test_blank_header_numeric_column_is_written_as_numbers(self):
+        headers = ["CTGLabel", "LimViolCat", "LimViolID", "LimViolPct", "", "Extra"]
+        rows = [
+            ["CTG 1", "Branch MVA", "Line 1", "95", "007", "x"],
+            ["CTG 2", "Branch MVA", "Line 2", "90", "100", "y"],
+            # Dropped by the row filter, but its float still types the column.
+            ["CTG 3", "Bus Low Volts", "Bus 7", "80", "1e5", "z"],
+            ["CTG 4", "Branch MVA", "Line 3", "85", "", "w"],
+        ]
+        with mock.patch.object(case_processor, "CSV_CHUNK_ROWS", 2):
+            self._write_export(headers, rows)
+            out = self._run()
+
+        self.assertEqual(
+            self._read(out),
+            "CTGLabel,LimViolID,LimViolPct,,Extra\n"
+            "CTG 1,Line 1,95,7.0,x\n"
+            "CTG 2,Line 2,90,100.0,y\n"
+            "CTG 4,Line 3,85,,w\n",
+        )
+        self.assertEqual(self._removed_rows(), 1)
+
+    def test_blank_header_text_column_stays_text(self):
+        headers = ["CTGLabel", "LimViolCat", "LimViolID", "LimViolPct", ""]
+        rows = [
+            ["CTG 1", "Branch MVA", "Line 1", "95", "007"],
+            ["CTG 2", "Bus Low Volts", "Bus 7", "80", "abc"],
+        ]
+        self._write_export(headers, rows)
+
+        out = self._run()
+
+        self.assertEqual(
+            self._read(out),
+            "CTGLabel,LimViolID,LimViolPct,\n"
+            "CTG 1,Line 1,95,007\n",
+        )
+
+    def test_header_only_export_has_nothing_to_filter(self):
+        self._write_export(HEADERS)
+
+        self.assertIsNone(self._run())
+        self.assertIn("No data rows found after header row; nothing to filter.", self.logs)
+
+    def test_title_only_export_has_no_headers(self):
+        self._write_export()
+
+        self.assertIsNone(self._run())
+        self.assertIn(
+            "Not enough rows in CSV to extract headers (need at least 1).", self.logs
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import unittest
 
 from openpyxl import Workbook, load_workbook
 
-from core.case_finder import _classify_case
+from core.case_finder import _classify_case, _find_pwb_files, list_subfolders
 from core.case_types import CASE_TYPE_DEFINITIONS
 from core.comparator import (
     build_all_case_type_comparisons,
@@ -66,6 +66,29 @@ class CaseTypeIntegrationTests(unittest.TestCase):
         self.assertEqual(_classify_case("Study_AUXapplied_Final.pwb"), "AUXapplied")
         self.assertEqual(_classify_case("study_auxapplied_final.PWB"), "AUXapplied")
 
+    def test_filename_matching_several_patterns_uses_first_case_type(self):
+        self.assertEqual(
+            _classify_case("AUXapplied_vs_acca_longterm.pwb"), "ACCA_LongTerm"
+        )
+        self.assertEqual(_classify_case("Study_Base.pwb"), "Other")
+
+    def test_pwb_listing_matches_names_and_subfolders_are_directories(self):
+        root = self.temp_dir.name
+        for name in ("b_ACCA.pwb", "A_dc.PWB", "notes.txt"):
+            open(os.path.join(root, name), "w").close()
+        os.mkdir(os.path.join(root, "Scenario2"))
+        os.mkdir(os.path.join(root, "old.pwb"))
+
+        self.assertEqual(
+            _find_pwb_files(root),
+            [
+                ("A_dc.PWB", os.path.join(root, "A_dc.PWB")),
+                ("b_ACCA.pwb", os.path.join(root, "b_ACCA.pwb")),
+                ("old.pwb", os.path.join(root, "old.pwb")),
+            ],
+        )
+        self.assertEqual(list_subfolders(root), ["Scenario2", "old.pwb"])
+
     def test_all_case_types_compare_and_duplicate_keys_use_maximum(self):
         comparisons = build_all_case_type_comparisons(
             self.source_path, "Left", "Right"
@@ -123,6 +146,10 @@ class CaseTypeIntegrationTests(unittest.TestCase):
             wb["Left vs Right"].cell(row=2, column=2).value,
             "No rows above threshold.",
         )
+        self.assertEqual(
+            wb["Straight Comparison"].cell(row=2, column=2).value,
+            "No rows above threshold.",
+        )
         wb.close()
 
 